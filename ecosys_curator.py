@@ -3,24 +3,45 @@ import wx.grid
 try:
     import wx.lib.agw.aui as aui
 except ImportError:
-    print("Warning: Advanced AUI not available, using basic layout")
     aui = None
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import pandas as pd
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+try:
+    import ijson
+except ImportError:
+    ijson = None
+import matplotlib
+matplotlib.use('WXAgg')  # Pin the wx Agg backend before pyplot is imported
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
 import os
+import pickle
+import re
+import shutil
+import tempfile
+import itertools
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, deque
+from functools import lru_cache
 from datetime import datetime
-import zipfile
-import io
 try:
     from PIL import Image
 except ImportError:
-    print("Warning: PIL not available, image display disabled")
     Image = None
 import base64
 from urllib.parse import urlparse, urljoin
@@ -30,6 +51,245 @@ import gc
 import time
 import weakref
 import sys
+import logging
+
+logger = logging.getLogger(__name__)
+
+if aui is None:
+    logger.warning("Advanced AUI not available, using basic layout")
+if Image is None:
+    logger.warning("PIL not available, image display disabled")
+
+# Upper bound on concurrent requests issued by the download queue
+MAX_PARALLEL_DOWNLOADS = 8
+# Bytes written between per-item progress updates of an export download
+DOWNLOAD_PROGRESS_STEP = 1 << 20
+
+# (connect, read) timeouts in seconds for EcoSIS API requests
+API_TIMEOUT = (5, 30)
+
+# Concurrent page requests when loading the dataset catalog
+API_PAGE_WORKERS = 4
+
+# Concurrent spectra block requests shared by all single-dataset downloads
+SPECTRA_BLOCK_WORKERS = 4
+# Blocks each download keeps in flight, so parallel downloads share the workers and few blocks wait in memory
+SPECTRA_BLOCK_WINDOW = 2 * SPECTRA_BLOCK_WORKERS
+
+# Spectral statistics payloads kept for the vegetation index calculator
+STATS_CACHE_SIZE = 32
+
+# Spectra plotted from a downloaded spectra_*.json file
+LOCAL_PLOT_SPECTRA = 15
+
+# Merged file entries are staged in memory up to this size, then spill to a temporary file
+MERGE_SPOOL_SIZE = 16 << 20
+
+# Plotted vertices per horizontal canvas pixel; spectra several times denser are downsampled with lttb()
+PLOT_POINTS_PER_PIXEL = 2
+PLOT_DOWNSAMPLE_FACTOR = 4
+
+# Width reserved for the spectra count patched into a streamed spectra_*.json header
+SPECTRA_TOTAL_WIDTH = 20
+
+# Title characters replaced with '_' when building spectra and export filenames
+FILENAME_TRANSLATION = str.maketrans(dict.fromkeys(' /\\\x00:*?"<>|', '_'))
+
+# Longest normalized title used in a filename
+MAX_FILENAME_TITLE = 200
+
+# Spectrum metadata fields tried, in order, for plot legend labels
+SPECTRUM_LABEL_FIELDS = (
+    ('Scientific Name', '{}'),
+    ('Common Name', '{}'),
+    ('Sample ID', 'ID: {}'),
+    ('Specimen ID', 'ID: {}'),
+    ('ID', 'ID: {}'),
+    ('Sample_ID', 'ID: {}'),
+    ('Unique_ID', 'ID: {}'),
+)
+
+# Local filter results remembered per (search, theme, organization) for the loaded catalog
+FILTER_CACHE_SIZE = 64
+
+# Decoded photo thumbnails kept in memory (least recently used are evicted)
+PHOTO_CACHE_SIZE = 128
+
+# Bounding box of the primary photo shown for the selected dataset
+PRIMARY_PHOTO_SIZE = (320, 240)
+
+# Saved settings (base URL, download folder, environment)
+CONFIG_FILE = "ecosys_config.json"
+
+# On-disk HTTP cache for catalog searches (kept next to CONFIG_FILE)
+HTTP_CACHE_FILE = "ecosis_cache.sqlite"
+HTTP_CACHE_EXPIRE = 3600  # seconds
+
+def json_loads(data):
+    """Parse JSON bytes or text with orjson when available, falling back to the json module"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Parse errors raised by the JSON readers in use (orjson's error subclasses json's)
+JSON_DECODE_ERRORS = (json.JSONDecodeError,) if ijson is None else (json.JSONDecodeError, ijson.JSONError)
+
+def json_dumps(obj, indent=False):
+    """Serialize obj to JSON bytes with orjson when available, optionally with a 2-space indent"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+def extract_spectrum(datapoints, min_wavelength=300, max_wavelength=2500):
+    """Return wavelength-sorted float32 (wavelengths, reflectance) arrays for the numeric datapoints in range"""
+    try:
+        # NumPy parses the key and value strings in C, with no Python float() per datapoint
+        wavelengths = np.array(list(datapoints), dtype=np.float64)
+        reflectance = np.array(list(datapoints.values()), dtype=np.float64)
+        # Equal-length list values parse into a 2-D array instead of failing
+        if wavelengths.ndim != 1 or reflectance.shape != wavelengths.shape:
+            raise ValueError("non-scalar datapoint values")
+    except (ValueError, TypeError):
+        # Metadata keys or unparsable values are mixed in; keep only the numeric pairs
+        pairs = []
+        for key, value in datapoints.items():
+            try:
+                pairs.append((float(key), float(value)))
+            except (ValueError, TypeError):
+                continue
+        packed = np.array(pairs, dtype=np.float64).reshape(-1, 2)
+        wavelengths, reflectance = packed[:, 0], packed[:, 1]
+    
+    # Missing (None) values come through as NaN and are dropped with the out-of-range points
+    in_range = (wavelengths >= min_wavelength) & (wavelengths <= max_wavelength) & ~np.isnan(reflectance)
+    wavelengths = wavelengths[in_range]
+    reflectance = reflectance[in_range]
+    order = np.argsort(wavelengths, kind='stable')
+    # Parsed in float64, stored in float32: reflectance carries ~3 significant digits
+    return wavelengths[order].astype(np.float32), reflectance[order].astype(np.float32)
+
+def wavelength_keys(stats_data):
+    """Return the numeric keys of a stats payload and their wavelengths as a float64 array"""
+    keys = []
+    wavelengths = []
+    for key in stats_data:
+        try:
+            wavelengths.append(float(key))
+        except ValueError:
+            continue
+        keys.append(key)
+    return keys, np.array(wavelengths, dtype=np.float64)
+
+def nearest_band(keys, wavelengths, target, tolerance):
+    """Key of the band closest to target, or None when no band lies within tolerance"""
+    if not len(wavelengths):
+        return None
+    distance = np.abs(wavelengths - target)
+    nearest = int(np.argmin(distance))
+    return keys[nearest] if distance[nearest] <= tolerance else None
+
+def safe_div(numerator, denominator):
+    """Elementwise numerator / denominator as float32, 0 where the denominator is zero"""
+    numerator, denominator = np.broadcast_arrays(np.asarray(numerator, dtype=np.float32),
+                                                 np.asarray(denominator, dtype=np.float32))
+    out = np.zeros(numerator.shape, dtype=np.float32)
+    return np.divide(numerator, denominator, out=out, where=denominator != 0)
+
+# Band name -> (label, centre wavelength, tolerance) in nm used by the vegetation index calculator
+INDEX_BANDS = {
+    'blue': ('Blue', 470, 20),
+    'green': ('Green', 550, 30),
+    'red': ('Red', 670, 20),
+    'nir': ('NIR', 800, 50),
+}
+
+# Vegetation indices as (name, bands used, formula over a band -> reflectance array mapping)
+VEGETATION_INDICES = (
+    ('NDVI', ('red', 'nir'), lambda b: safe_div(b['nir'] - b['red'], b['nir'] + b['red'])),
+    ('Simple Ratio (SR)', ('red', 'nir'), lambda b: safe_div(b['nir'], b['red'])),
+    ('GNDVI', ('green', 'nir'), lambda b: safe_div(b['nir'] - b['green'], b['nir'] + b['green'])),
+    ('EVI', ('blue', 'red', 'nir'),
+     lambda b: safe_div(2.5 * (b['nir'] - b['red']), b['nir'] + 6 * b['red'] - 7.5 * b['blue'] + 1)),
+)
+
+def compute_indices(reflectances):
+    """Evaluate every vegetation index whose bands are present in a band -> reflectance mapping
+
+    Values may be scalars or equally shaped arrays; each index comes back as a float32 array
+    of that shape, computed in one vectorized pass.
+    """
+    bands = {band: np.asarray(values, dtype=np.float32) for band, values in reflectances.items()}
+    return {index_name: formula(bands)
+            for index_name, required, formula in VEGETATION_INDICES
+            if all(band in bands for band in required)}
+
+@lru_cache(maxsize=1024)
+def metadata_key_label(key):
+    """Display label for a metadata key, e.g. 'package_title' -> 'Package Title'"""
+    return key.title().replace('_', ' ')
+
+def iter_stripped_strings(value):
+    """Yield the non-empty stripped strings of a list or string metadata field, interned"""
+    # Organizations and themes repeat across datasets; interning keeps one copy of each
+    if isinstance(value, list):
+        for item in value:
+            if item:
+                text = str(item).strip()
+                if text:
+                    yield sys.intern(text)
+    elif isinstance(value, str):
+        text = value.strip()
+        if text:
+            yield sys.intern(text)
+
+# Centre wavelengths of INDEX_BANDS, in table order, sampled from each loaded spectrum
+INDEX_BAND_CENTRES = np.array([centre for label, centre, tolerance in INDEX_BANDS.values()], dtype=np.float64)
+
+def sample_spectra(spectra, wavelengths):
+    """Linearly interpolate each spectrum at the given wavelengths as an (N, bands) float32 matrix; NaN outside a spectrum"""
+    out = np.full((len(spectra), len(wavelengths)), np.nan, dtype=np.float32)
+    for i, spectrum in enumerate(spectra):
+        spectrum_wavelengths = np.asarray(spectrum['wavelengths'], dtype=np.float64)
+        if len(spectrum_wavelengths):
+            out[i] = np.interp(wavelengths, spectrum_wavelengths,
+                               np.asarray(spectrum['reflectance'], dtype=np.float64),
+                               left=np.nan, right=np.nan)
+    return out
+
+def lttb(x, y, n_out):
+    """Downsample a curve to n_out points with Largest-Triangle-Three-Buckets, keeping its visible shape
+
+    Each bucket's triangle is anchored on the mean of the previous bucket rather than on the point
+    picked there, so every bucket is scored in one vectorized pass instead of a sequential loop.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    # Interior points fall into n_out - 2 buckets; the first and last points are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    starts = edges[:-1]
+    sizes = np.diff(edges)
+    bucket = np.repeat(np.arange(len(starts)), sizes)
+    inner_x = x[1:n - 1].astype(np.float64)
+    inner_y = y[1:n - 1].astype(np.float64)
+    mean_x = np.add.reduceat(inner_x, starts - 1) / sizes
+    mean_y = np.add.reduceat(inner_y, starts - 1) / sizes
+    
+    # Triangle vertices: previous bucket mean (first point for bucket 0) and next bucket mean (last point at the end)
+    prev_x = np.concatenate(([x[0]], mean_x[:-1]))[bucket]
+    prev_y = np.concatenate(([y[0]], mean_y[:-1]))[bucket]
+    next_x = np.concatenate((mean_x[1:], [x[-1]]))[bucket]
+    next_y = np.concatenate((mean_y[1:], [y[-1]]))[bucket]
+    area = np.abs((prev_x - next_x) * (inner_y - prev_y) - (prev_x - inner_x) * (next_y - prev_y))
+    
+    # First point of each bucket that reaches the bucket's largest area
+    is_max = area == np.maximum.reduceat(area, starts - 1)[bucket]
+    candidates = np.flatnonzero(is_max)
+    first = candidates[np.unique(bucket[candidates], return_index=True)[1]]
+    
+    keep = np.concatenate(([0], first + 1, [n - 1]))
+    return x[keep], y[keep]
 
 class BatchProgressDialog(wx.Dialog):
     """Non-blocking progress dialog for batch processing"""
@@ -253,7 +513,7 @@ class MemoryMonitor:
         
     def emergency_cleanup(self):
         """Perform emergency memory cleanup"""
-        print("DEBUG: Emergency memory cleanup initiated")
+        logger.debug("Emergency memory cleanup initiated")
         
         # Clear tracked objects
         for obj in list(self._tracked_objects):
@@ -268,7 +528,7 @@ class MemoryMonitor:
         # Force garbage collection
         for _ in range(3):
             collected = gc.collect()
-            print(f"DEBUG: GC collected {collected} objects")
+            logger.debug("GC collected %s objects", collected)
         
         # Clear module caches if available
         if hasattr(sys, '_clear_type_cache'):
@@ -283,13 +543,13 @@ class MemoryMonitor:
             
             # Critical memory situation
             if system_percent > self.oom_protection_threshold:
-                print(f"CRITICAL: System memory at {system_percent}% - initiating emergency cleanup")
+                logger.critical("System memory at %s%% - initiating emergency cleanup", system_percent)
                 self.emergency_cleanup()
                 return True
             
             # Very low available memory
             if available_gb < 0.2:  # Less than 200MB available
-                print(f"CRITICAL: Only {available_gb:.2f}GB available - emergency cleanup")
+                logger.critical("Only %.2fGB available - emergency cleanup", available_gb)
                 self.emergency_cleanup()
                 return True
                 
@@ -300,13 +560,13 @@ class MemoryMonitor:
             if (system_percent > self.critical_threshold_percent or 
                 memory_growth_mb > 500 or  # Reduced from 800MB
                 current_memory_mb > 800):  # Reduced from 1200MB
-                print(f"DEBUG: Memory pause - System: {system_percent}%, Growth: {memory_growth_mb}MB")
+                logger.debug("Memory pause - System: %s%%, Growth: %sMB", system_percent, memory_growth_mb)
                 return True
                 
             return False
             
         except Exception as e:
-            print(f"DEBUG: Memory monitoring error: {e}")
+            logger.debug("Memory monitoring error: %s", e)
             # On error, assume we should pause to be safe
             return True
             
@@ -329,7 +589,7 @@ class SafeDataProcessor:
             for i in range(0, len(data_items), self.chunk_size):
                 # Check memory before each chunk
                 if self.memory_monitor.should_pause_processing():
-                    print(f"DEBUG: Pausing at chunk {i//self.chunk_size + 1} due to memory pressure")
+                    logger.debug("Pausing at chunk %s due to memory pressure", i//self.chunk_size + 1)
                     break
                 
                 chunk = data_items[i:i + self.chunk_size]
@@ -355,13 +615,13 @@ class SafeDataProcessor:
                         gc.collect()
                         
                 except Exception as e:
-                    print(f"DEBUG: Error processing chunk {i//self.chunk_size}: {e}")
+                    logger.debug("Error processing chunk %s: %s", i//self.chunk_size, e)
                     continue
             
             return results
             
         except Exception as e:
-            print(f"DEBUG: Fatal error in data processing: {e}")
+            logger.debug("Fatal error in data processing: %s", e)
             self.memory_monitor.emergency_cleanup()
             return []
         finally:
@@ -383,13 +643,13 @@ class SafeJSONProcessor:
             file_size_mb = os.path.getsize(filepath) / (1024 * 1024)
             
             if file_size_mb > 50:  # Files larger than 50MB
-                print(f"DEBUG: Large file detected ({file_size_mb:.1f}MB) - using streaming")
+                logger.debug("Large file detected (%.1fMB) - using streaming", file_size_mb)
                 return self.stream_large_json(filepath, output_stream)
             else:
                 return self.process_small_json(filepath, output_stream)
                 
         except Exception as e:
-            print(f"DEBUG: JSON processing error for {filepath}: {e}")
+            logger.debug("JSON processing error for %s: %s", filepath, e)
             return 0
     
     def stream_large_json(self, filepath, output_stream):
@@ -421,7 +681,7 @@ class SafeJSONProcessor:
                 
                 for i in range(0, len(spectra), batch_size):
                     if self.memory_monitor.should_pause_processing():
-                        print(f"DEBUG: Memory pressure - stopping at spectrum {i}")
+                        logger.debug("Memory pressure - stopping at spectrum %s", i)
                         break
                     
                     batch = spectra[i:i + batch_size]
@@ -448,11 +708,11 @@ class SafeJSONProcessor:
                 return spectra_count
                 
         except MemoryError:
-            print(f"DEBUG: Memory error processing {filepath}")
+            logger.debug("Memory error processing %s", filepath)
             self.memory_monitor.emergency_cleanup()
             return 0
         except Exception as e:
-            print(f"DEBUG: Error streaming {filepath}: {e}")
+            logger.debug("Error streaming %s: %s", filepath, e)
             return 0
     
     def write_dataset_header(self, output_stream, dataset_info, filepath):
@@ -496,7 +756,7 @@ class MergeState:
                 json.dump(state_data, f, indent=2)
                 
         except Exception as e:
-            print(f"DEBUG: Error saving merge state: {e}")
+            logger.debug("Error saving merge state: %s", e)
             
     def load_state(self):
         """Load merge state from file if it exists"""
@@ -514,7 +774,7 @@ class MergeState:
                 return os.path.exists(self.temp_filepath)
                 
         except Exception as e:
-            print(f"DEBUG: Error loading merge state: {e}")
+            logger.debug("Error loading merge state: %s", e)
             
         return False
         
@@ -526,7 +786,208 @@ class MergeState:
             if os.path.exists(self.temp_filepath):
                 os.remove(self.temp_filepath)
         except Exception as e:
-            print(f"DEBUG: Error cleaning up merge state: {e}")
+            logger.debug("Error cleaning up merge state: %s", e)
+
+class DatasetView:
+    """Read-only filtered view over a list of datasets, kept as an index array instead of copied rows"""
+    
+    def __init__(self, datasets, indices=None):
+        self.datasets = datasets
+        if indices is None:
+            indices = np.arange(len(datasets), dtype=np.intp)
+        self.indices = indices
+        
+    def __len__(self):
+        return len(self.indices)
+        
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return DatasetView(self.datasets, self.indices[row])
+        return self.datasets[self.indices[row]]
+        
+    def __iter__(self):
+        datasets = self.datasets
+        for i in self.indices.tolist():
+            yield datasets[i]
+
+class EcoSISGridTable(wx.grid.GridTableBase):
+    """Virtual grid table that renders rows straight from the curator's filtered_data"""
+    
+    headers = ["Download", "ID", "Title", "Organization", "Spectra Count", "Keywords", "Theme", "Status"]
+    
+    def __init__(self, curator):
+        super().__init__()
+        self.curator = curator
+        self.local_attr = None
+        
+    def GetNumberRows(self):
+        return len(self.curator.filtered_data)
+        
+    def GetNumberCols(self):
+        return len(self.headers)
+        
+    def GetColLabelValue(self, col):
+        return self.headers[col]
+        
+    def IsEmptyCell(self, row, col):
+        return False
+        
+    def GetTypeName(self, row, col):
+        if col == 0:
+            return wx.grid.GRID_VALUE_BOOL
+        return wx.grid.GRID_VALUE_STRING
+        
+    def CanGetValueAs(self, row, col, type_name):
+        if col == 0:
+            return type_name == wx.grid.GRID_VALUE_BOOL
+        return type_name == wx.grid.GRID_VALUE_STRING
+        
+    def CanSetValueAs(self, row, col, type_name):
+        return self.CanGetValueAs(row, col, type_name)
+        
+    def dataset_at(self, row):
+        """Return the dataset shown at a grid row, or None when out of range"""
+        filtered_data = self.curator.filtered_data
+        if 0 <= row < len(filtered_data):
+            return filtered_data[row]
+        return None
+        
+    def is_local(self, dataset):
+        """Local-availability flag stamped on the dataset, so repaints never hit the filesystem"""
+        return self.curator.is_dataset_local(dataset)
+        
+    def row_of(self, dataset):
+        """Return the grid row currently showing dataset, or None when it is filtered out"""
+        for row, candidate in enumerate(self.curator.filtered_data):
+            if candidate is dataset:
+                return row
+        return None
+        
+    def mark_local(self, dataset):
+        """Record that a dataset now has local data"""
+        dataset['_is_local'] = True
+        
+    def set_status(self, dataset, status):
+        """Override a dataset's Status cell whether or not it is currently shown"""
+        dataset.setdefault('_cells', {})[7] = str(status)
+        
+    def clear_status(self, dataset):
+        """Drop a dataset's Download and Status overrides so both follow its local flag again"""
+        cells = dataset.get('_cells')
+        if cells:
+            cells.pop(0, None)
+            cells.pop(7, None)
+            
+    def reset(self):
+        """Drop the shared local-row attribute so it is rebuilt on the next repaint"""
+        self.local_attr = None
+        
+    def GetValue(self, row, col):
+        dataset = self.dataset_at(row)
+        if dataset is None:
+            return ""
+        # Values set through SetValue live on the dataset, so a reloaded catalog starts clean
+        override = dataset.get('_cells', {}).get(col)
+        if override is not None:
+            return override
+        if col == 0:
+            return "1" if self.is_local(dataset) else "0"
+        if col == 7:
+            return "Downloaded" if self.is_local(dataset) else "Available"
+        return self.row_cells(dataset)[col - 1]
+        
+    def SetValue(self, row, col, value):
+        dataset = self.dataset_at(row)
+        if dataset is not None:
+            dataset.setdefault('_cells', {})[col] = str(value)
+            
+    def GetValueAsBool(self, row, col):
+        return self.GetValue(row, col) == "1"
+        
+    def SetValueAsBool(self, row, col, value):
+        self.SetValue(row, col, "1" if value else "0")
+        
+    def GetAttr(self, row, col, kind):
+        dataset = self.dataset_at(row)
+        if dataset is None or not self.is_local(dataset):
+            return None
+        if self.local_attr is None:
+            self.local_attr = wx.grid.GridCellAttr()
+            # Colour for the curator's cached dark/light mode
+            self.local_attr.SetBackgroundColour(self.curator._local_row_colours[self.curator._is_dark])
+        # The grid releases the returned attribute, so hand out a new reference
+        self.local_attr.IncRef()
+        return self.local_attr
+        
+    def row_cells(self, dataset):
+        """Display strings for columns 1-6, formatted once and cached on the dataset"""
+        cells = dataset.get('_row')
+        if cells is None:
+            cells = tuple(self.format_cell(dataset, col) for col in range(1, 7))
+            dataset['_row'] = cells
+        return cells
+        
+    def format_cell(self, dataset, col):
+        """Format one display column of an EcoSIS dataset"""
+        ecosis_info = dataset.get('ecosis', {})
+        
+        if col == 1:
+            return str(dataset.get('_id', ''))
+            
+        if col == 2:
+            # Title - use ecosis.package_title or title
+            title = ecosis_info.get('package_title', '')
+            if not title:
+                title = ecosis_info.get('title', '')
+            if not title:
+                # Fallback to package_id if both are missing
+                title = ecosis_info.get('package_id', 'Unknown')
+            return str(title)
+            
+        if col == 3:
+            # Organization - handle both string and list properly
+            organization = ecosis_info.get('organization', [])
+            if isinstance(organization, list):
+                return ', '.join(map(str, filter(None, organization)))
+            elif isinstance(organization, str):
+                return organization
+            return 'Unknown'
+            
+        if col == 4:
+            return str(ecosis_info.get('spectra_count', 0))
+            
+        if col == 5:
+            # Keywords - use Keywords from main dataset
+            keywords = dataset.get('Keywords', [])
+            if not keywords:
+                # Fallback to ecosis.keyword if main Keywords is empty
+                keywords = ecosis_info.get('keyword', [])
+            
+            if isinstance(keywords, list):
+                keywords_str = ', '.join(map(str, filter(None, keywords[:3])))  # Show first 3 keywords
+                if len(keywords) > 3:
+                    keywords_str += f'... ({len(keywords)} total)'
+                return keywords_str
+            elif isinstance(keywords, str):
+                return keywords
+            return ''
+            
+        if col == 6:
+            # Theme - use Theme from main dataset
+            theme_list = dataset.get('Theme', [])
+            if isinstance(theme_list, list):
+                return ', '.join(map(str, filter(None, theme_list[:2])))  # Show first 2 themes
+            elif isinstance(theme_list, str):
+                return theme_list
+            # Fallback to Category if Theme is not available
+            category_list = dataset.get('Category', [])
+            if isinstance(category_list, list):
+                return ', '.join(map(str, filter(None, category_list[:2])))
+            elif isinstance(category_list, str):
+                return category_list
+            return ''
+            
+        return ''
 
 class EcosysAPICurator(wx.Frame):
     def __init__(self):
@@ -538,10 +999,41 @@ class EcosysAPICurator(wx.Frame):
         
         # Initialize variables
         self.api_data = []
-        self.filtered_data = []
+        self.filtered_data = DatasetView(self.api_data)
+        self.search_index = None
         self.current_selection = None
+        self.selection_dirty = False  # Metadata/photos for current_selection still to be shown
         self.download_progress = 0
         self.dataset_photos = {}
+        self.photo_thumbnail_cache = OrderedDict()
+        self.photo_thumbnail_lock = threading.Lock()
+        # Bitmaps wrapped from photo_thumbnail_cache entries, same keys; only touched on the GUI thread
+        self.photo_bitmap_cache = OrderedDict()
+        
+        # Fonts shared by every panel/photo redraw instead of being rebuilt per widget
+        self._teletype_font = wx.Font(9, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
+        self._primary_title_font = wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        self._heading_font = wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD)
+        self._placeholder_font = wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL)
+        self._body_font = wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
+        self._note_font = wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL)
+        self._caption_font = wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL)
+        
+        # Dark mode is looked up once and refreshed only when the system colours change
+        self._is_dark = wx.SystemSettings.GetAppearance().IsDark()
+        self._local_row_colours = {
+            True: wx.Colour(45, 55, 80),     # Dark blue-gray
+            False: wx.Colour(230, 240, 255),  # Light blue
+        }
+        
+        # Photo download status colours
+        self._photo_status_colours = {
+            'completed': wx.Colour(0, 150, 0),
+            'downloading': wx.Colour(0, 100, 200),
+            'pending': wx.Colour(150, 150, 0),
+            'failed': wx.Colour(200, 0, 0),
+            'unknown': wx.Colour(100, 100, 100),
+        }
         
         # Photo download tracking - thread safe
         self.active_photo_downloads = set()
@@ -556,6 +1048,8 @@ class EcosysAPICurator(wx.Frame):
         
         # Bind close event for proper cleanup
         self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.Bind(wx.EVT_SYS_COLOUR_CHANGED, self.on_sys_colour_changed)
+        self.Bind(wx.EVT_IDLE, self.on_idle)
 
     def thread_safe_photo_download(self, dataset_id, photos):
         """Thread-safe photo download management"""
@@ -592,6 +1086,7 @@ class EcosysAPICurator(wx.Frame):
             ('photo_refresh_timer', 'photo refresh timer'),
             ('search_timer', 'search timer'),
             ('resize_timer', 'resize timer'),
+            ('path_timer', 'download path timer'),
             ('batch_status_timer', 'batch status timer')
         ]
         
@@ -600,23 +1095,71 @@ class EcosysAPICurator(wx.Frame):
                 if hasattr(self, timer_name):
                     timer = getattr(self, timer_name)
                     if timer and hasattr(timer, 'IsRunning') and timer.IsRunning():
-                        print(f"DEBUG: Stopping {description}")
+                        logger.debug("Stopping %s", description)
                         timer.Stop()
                     # Clear the reference
                     setattr(self, timer_name, None)
             except Exception as e:
-                print(f"DEBUG: Error stopping {description}: {e}")
+                logger.debug("Error stopping %s: %s", description, e)
 
+    def create_http_session(self):
+        """Create the shared pooled HTTP session, caching catalog searches on disk when requests-cache is installed"""
+        session = self.create_base_session()
+        
+        # One keep-alive pool sized for the parallel downloads, retrying transient gateway errors
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_PARALLEL_DOWNLOADS,
+                              max_retries=Retry(total=3, backoff_factor=0.3,
+                                                status_forcelist=[429, 502, 503, 504]))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['Accept-Encoding'] = 'gzip, deflate'
+        return session
+        
+    def create_base_session(self):
+        """Create a requests-cache session when available, otherwise a plain requests session"""
+        if requests_cache is None:
+            return requests.Session()
+        
+        try:
+            # Only search pages are cached; exports and photos are streamed straight to disk
+            return requests_cache.CachedSession(
+                HTTP_CACHE_FILE,
+                backend='sqlite',
+                expire_after=HTTP_CACHE_EXPIRE,
+                allowable_codes=(200,),
+                stale_if_error=True,
+                urls_expire_after={
+                    '*/api/package/search': HTTP_CACHE_EXPIRE,
+                    '*': requests_cache.DO_NOT_CACHE,
+                },
+            )
+        except Exception as e:
+            logger.debug("HTTP cache unavailable, using plain session: %s", e)
+            return requests.Session()
+        
     def cleanup_threads(self):
         """Clean up background threads"""
         try:
             # Mark any active downloads as cancelled
             self.active_photo_downloads.clear()
             
+            # A catalog load in progress sees itself as stale, so its queued pages return without fetching
+            if hasattr(self, 'catalog_request_lock'):
+                self.cancel_catalog_request()
+            
             # Set error state for batch processing to stop gracefully
             if hasattr(self, 'batch_progress'):
                 self.batch_progress['error'] = "Application closing"
             
+            # Release paused download workers and drop queued downloads
+            if hasattr(self, 'download_executor'):
+                self.download_resume_event.set()
+                self.download_executor.shutdown(wait=False, cancel_futures=True)
+            if hasattr(self, 'executor'):
+                self.executor.shutdown(wait=False, cancel_futures=True)
+            if hasattr(self, 'block_executor'):
+                self.block_executor.shutdown(wait=False, cancel_futures=True)
+            
             # Close progress dialog if open
             if hasattr(self, 'progress_dialog') and self.progress_dialog:
                 try:
@@ -626,7 +1169,7 @@ class EcosysAPICurator(wx.Frame):
                     pass
                 
         except Exception as e:
-            print(f"DEBUG: Thread cleanup error: {e}")
+            logger.debug("Thread cleanup error: %s", e)
 
     def safe_call_after(self, func, *args, **kwargs):
         """Thread-safe wrapper for wx.CallAfter"""
@@ -640,7 +1183,7 @@ class EcosysAPICurator(wx.Frame):
                         if not self._destroyed:
                             func(*args, **kwargs)
                 except Exception as e:
-                    print(f"DEBUG: Safe call after error: {e}")
+                    logger.debug("Safe call after error: %s", e)
         
         try:
             wx.CallAfter(safe_wrapper)
@@ -648,9 +1191,30 @@ class EcosysAPICurator(wx.Frame):
             # wxPython may be shutting down
             pass
 
+    def on_sys_colour_changed(self, event):
+        """Re-read dark mode and restyle the grid highlight and spectral plot"""
+        event.Skip()
+        is_dark = wx.SystemSettings.GetAppearance().IsDark()
+        if is_dark == self._is_dark:
+            return
+        self._is_dark = is_dark
+        
+        self.grid_table.reset()
+        self.data_grid.ForceRefresh()
+        
+        # Restore the matplotlib defaults when leaving dark mode so new artists stop inheriting dark rcParams
+        plt.style.use('dark_background' if is_dark else 'default')
+        self.spectral_figure.patch.set_facecolor('#2b2b2b' if is_dark else 'white')
+        if self.cached_spectral_data:
+            self.plot_cached_spectral_data()
+        else:
+            self.spectral_axes.clear()
+            self.configure_spectral_plot()
+            self.initialize_spectral_plot()
+        
     def on_close(self, event):
         """Enhanced close handler with proper thread cleanup"""
-        print("DEBUG: Starting application shutdown...")
+        logger.debug("Starting application shutdown...")
         
         # Set destruction flag immediately
         self._destroyed = True
@@ -658,6 +1222,7 @@ class EcosysAPICurator(wx.Frame):
         # Stop all background operations
         with self.photo_download_lock:
             self.active_photo_downloads.clear()
+        self.cleanup_threads()
         
         # Stop all timers before destroying the window
         self.cleanup_timers_safe()
@@ -675,7 +1240,7 @@ class EcosysAPICurator(wx.Frame):
         except:
             pass
         
-        print("DEBUG: Cleanup complete, destroying window...")
+        logger.debug("Cleanup complete, destroying window...")
         
         # Destroy the window
         self.Destroy()
@@ -687,7 +1252,7 @@ class EcosysAPICurator(wx.Frame):
             self.Bind(wx.EVT_TIMER, self.on_photo_refresh_timer_safe, self.photo_refresh_timer)
             self.photo_refresh_timer.Start(3000)  # Increased to 3 seconds
         except Exception as e:
-            print(f"DEBUG: Failed to setup photo refresh timer: {e}")
+            logger.debug("Failed to setup photo refresh timer: %s", e)
             self.photo_refresh_timer = None
     
     def on_photo_refresh_timer_safe(self, event):
@@ -730,12 +1295,12 @@ class EcosysAPICurator(wx.Frame):
             
             # If we have updates, refresh the display
             if has_updates and not self._destroyed:
-                print(f"DEBUG: {len(newly_completed)} new photos completed for dataset {current_dataset_id}")
+                logger.debug("%s new photos completed for dataset %s", len(newly_completed), current_dataset_id)
                 wx.CallAfter(self.safe_refresh_current_photo_display)
                 
         except Exception as e:
             # Silently handle exceptions during timer callback
-            print(f"DEBUG: Timer callback error (likely cleanup): {e}")
+            logger.debug("Timer callback error (likely cleanup): %s", e)
   
     def safe_refresh_current_photo_display(self):
         """Safely refresh photo display with destruction check"""
@@ -746,7 +1311,7 @@ class EcosysAPICurator(wx.Frame):
             if hasattr(self, 'current_selection') and self.current_selection:
                 self.display_photos_for_dataset(self.current_selection)
         except Exception as e:
-            print(f"DEBUG: Photo display refresh error: {e}")
+            logger.debug("Photo display refresh error: %s", e)
 
     def init_ui(self):
         """Initialize the user interface with AUI manager or basic layout"""
@@ -918,7 +1483,7 @@ class EcosysAPICurator(wx.Frame):
         
         self.photo_panel_sizer = wx.BoxSizer(wx.VERTICAL)
         self.photo_label = wx.StaticText(self.photo_scroll, label="Select a dataset to view photos")
-        self.photo_label.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL))
+        self.photo_label.SetFont(self._placeholder_font)
         self.photo_panel_sizer.Add(self.photo_label, 0, wx.ALIGN_CENTER|wx.ALL, 10)
         
         self.photo_scroll.SetSizer(self.photo_panel_sizer)
@@ -945,14 +1510,10 @@ class EcosysAPICurator(wx.Frame):
         self.data_panel = wx.Panel(self)
         sizer = wx.BoxSizer(wx.VERTICAL)
         
-        # Grid for displaying datasets with checkbox column
+        # Virtual grid backed by filtered_data; the table supplies headers and the checkbox column
         self.data_grid = wx.grid.Grid(self.data_panel)
-        self.data_grid.CreateGrid(0, 8)  # Added checkbox column (8 columns total)
-        
-        # Set column headers for EcoSIS data (added checkbox column)
-        headers = ["Download", "ID", "Title", "Organization", "Spectra Count", "Keywords", "Theme", "Status"]
-        for i, header in enumerate(headers):
-            self.data_grid.SetColLabelValue(i, header)
+        self.grid_table = EcoSISGridTable(self)
+        self.data_grid.SetTable(self.grid_table, True)
             
         # Adjust column sizes (added checkbox column)
         self.data_grid.SetColSize(0, 80)   # Download checkbox
@@ -967,12 +1528,6 @@ class EcosysAPICurator(wx.Frame):
         self.data_grid.Bind(wx.grid.EVT_GRID_SELECT_CELL, self.on_grid_select)
         self.data_grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_CLICK, self.on_grid_cell_click)
         
-        # Set up checkbox column
-        checkbox_attr = wx.grid.GridCellAttr()
-        checkbox_attr.SetEditor(wx.grid.GridCellBoolEditor())
-        checkbox_attr.SetRenderer(wx.grid.GridCellBoolRenderer())
-        self.data_grid.SetColAttr(0, checkbox_attr)
-        
         sizer.Add(self.data_grid, 1, wx.EXPAND|wx.ALL, 5)
         
         # Selection info
@@ -987,16 +1542,21 @@ class EcosysAPICurator(wx.Frame):
         sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Matplotlib figure for spectral curves with responsive sizing
-        self.spectral_figure = Figure(figsize=(6, 4), tight_layout=True, dpi=100)
+        self.spectral_figure = Figure(figsize=(6, 4), constrained_layout=True, dpi=100)
         
         # Check for dark mode
-        if wx.SystemSettings.GetAppearance().IsDark():
+        if self._is_dark:
             self.spectral_figure.patch.set_facecolor('#2b2b2b')
             plt.style.use('dark_background')
         
         self.spectral_canvas = FigureCanvas(self.spectral_panel, -1, self.spectral_figure)
         self.spectral_axes = self.spectral_figure.add_subplot(111)
         
+        # Static background captured after each full draw so spectra can be blitted on top
+        self.spectral_background = None
+        self.spectral_background_size = None
+        self.spectral_canvas.mpl_connect('draw_event', self.on_spectral_draw)
+        
         # Configure initial plot appearance
         self.configure_spectral_plot()
         
@@ -1030,18 +1590,17 @@ class EcosysAPICurator(wx.Frame):
         
     def configure_spectral_plot(self):
         """Configure spectral plot appearance"""
-        # Check for dark mode and configure accordingly
-        if wx.SystemSettings.GetAppearance().IsDark():
-            # Dark mode colors
-            self.spectral_axes.set_facecolor('#1e1e1e')
-            self.spectral_axes.tick_params(colors='white')
-            self.spectral_axes.xaxis.label.set_color('white')
-            self.spectral_axes.yaxis.label.set_color('white')
-            self.spectral_axes.title.set_color('white')
-            self.spectral_axes.spines['bottom'].set_color('white')
-            self.spectral_axes.spines['top'].set_color('white')
-            self.spectral_axes.spines['right'].set_color('white')
-            self.spectral_axes.spines['left'].set_color('white')
+        # Colours are set explicitly for both modes so switching themes never leaves dark styling behind
+        face_colour, ink_colour = ('#1e1e1e', 'white') if self._is_dark else ('white', 'black')
+        self.spectral_axes.set_facecolor(face_colour)
+        self.spectral_axes.tick_params(colors=ink_colour)
+        self.spectral_axes.xaxis.label.set_color(ink_colour)
+        self.spectral_axes.yaxis.label.set_color(ink_colour)
+        self.spectral_axes.title.set_color(ink_colour)
+        self.spectral_axes.spines['bottom'].set_color(ink_colour)
+        self.spectral_axes.spines['top'].set_color(ink_colour)
+        self.spectral_axes.spines['right'].set_color(ink_colour)
+        self.spectral_axes.spines['left'].set_color(ink_colour)
         
         self.spectral_axes.set_title("Spectral Reflectance Curves")
         self.spectral_axes.set_xlabel("Wavelength (nm)")
@@ -1059,9 +1618,6 @@ class EcosysAPICurator(wx.Frame):
         self.spectral_axes.set_ylim(0, 1)
         self.spectral_axes.legend()
         
-        # Force initial layout calculation
-        self.spectral_figure.tight_layout()
-        
         # Use CallAfter to ensure proper sizing after window is fully constructed
         wx.CallAfter(self.initial_plot_resize)
         
@@ -1079,7 +1635,6 @@ class EcosysAPICurator(wx.Frame):
                 
                 # Set figure size to match canvas
                 self.spectral_figure.set_size_inches(fig_width, fig_height)
-                self.spectral_figure.tight_layout()
                 self.spectral_canvas.draw()
             else:
                 # If size isn't ready, try again in a moment
@@ -1106,14 +1661,42 @@ class EcosysAPICurator(wx.Frame):
         try:
             self.refresh_spectral_plot()
         except Exception as e:
-            print(f"DEBUG: Resize timer error: {e}")
+            logger.debug("Resize timer error: %s", e)
 
+    def on_spectral_draw(self, event):
+        """Cache the plot background after a full draw and paint the animated spectra over it"""
+        self.spectral_background = self.spectral_canvas.copy_from_bbox(self.spectral_figure.bbox)
+        self.spectral_background_size = tuple(self.spectral_canvas.GetSize())
+        
+        collection = getattr(self, 'spectral_collection', None)
+        if collection is not None and collection in self.spectral_axes.collections:
+            self.spectral_axes.draw_artist(collection)
+            
+    def blit_spectral_plot(self):
+        """Redraw only the spectra over the cached background, returns False if a full draw is needed"""
+        collection = getattr(self, 'spectral_collection', None)
+        if (self.spectral_background is None or collection is None
+                or collection not in self.spectral_axes.collections
+                or self.spectral_background_size != tuple(self.spectral_canvas.GetSize())):
+            return False
+        
+        self.spectral_canvas.restore_region(self.spectral_background)
+        self.spectral_axes.draw_artist(collection)
+        self.spectral_canvas.blit(self.spectral_axes.bbox)
+        return True
+        
     def refresh_spectral_plot(self):
         """Refresh spectral plot with current dimensions using cached data"""
         if hasattr(self, 'spectral_figure') and hasattr(self, 'spectral_canvas'):
             # Get current canvas size
             canvas_size = self.spectral_canvas.GetSize()
             
+            # Same size and same spectra: reuse the cached background
+            if (getattr(self, 'spectral_collection_source', None) is not None
+                    and self.spectral_collection_source is self.cached_spectral_data
+                    and self.blit_spectral_plot()):
+                return
+            
             if canvas_size.width > 10 and canvas_size.height > 10:
                 # Update figure size to match canvas
                 dpi = self.spectral_figure.dpi
@@ -1122,12 +1705,14 @@ class EcosysAPICurator(wx.Frame):
                 
                 self.spectral_figure.set_size_inches(fig_width, fig_height)
                 
-                # If we have cached spectral data, replot it efficiently
+                # If the cached spectra are already on the axes, only a redraw is needed
                 if hasattr(self, 'cached_spectral_data') and self.cached_spectral_data:
-                    self.plot_cached_spectral_data()
+                    if getattr(self, 'spectral_collection_source', None) is self.cached_spectral_data:
+                        self.spectral_canvas.draw_idle()
+                    else:
+                        self.plot_cached_spectral_data()
                 else:
-                    # Just apply layout for placeholder or empty plot
-                    self.spectral_figure.tight_layout()
+                    # Constrained layout is applied by the draw itself
                     self.spectral_canvas.draw()
         
     def create_metadata_panel(self):
@@ -1137,7 +1722,7 @@ class EcosysAPICurator(wx.Frame):
         
         # Simple metadata text display
         self.metadata_text = wx.TextCtrl(self.metadata_panel, style=wx.TE_MULTILINE|wx.TE_READONLY)
-        self.metadata_text.SetFont(wx.Font(9, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+        self.metadata_text.SetFont(self._teletype_font)
         sizer.Add(self.metadata_text, 1, wx.EXPAND|wx.ALL, 5)
         
         self.metadata_panel.SetSizer(sizer)
@@ -1157,6 +1742,9 @@ class EcosysAPICurator(wx.Frame):
         self.download_list.AppendColumn("Progress", width=100)
         self.download_list.AppendColumn("Size", width=80)
         
+        # Catalog entry behind each queue row, kept index-aligned with download_list
+        self.download_queue_datasets = []
+        
         queue_sizer.Add(self.download_list, 1, wx.EXPAND|wx.ALL, 5)
         
         # Download controls
@@ -1190,6 +1778,7 @@ class EcosysAPICurator(wx.Frame):
         location_sizer = wx.BoxSizer(wx.HORIZONTAL)
         location_sizer.Add(wx.StaticText(self.download_panel, label="Download to:"), 0, wx.ALIGN_CENTER_VERTICAL|wx.ALL, 5)
         self.download_path = wx.TextCtrl(self.download_panel, value=os.path.expanduser("~/Downloads/EcoSISData"))
+        self.download_path.Bind(wx.EVT_TEXT, self.on_download_path_change)
         location_sizer.Add(self.download_path, 1, wx.EXPAND|wx.ALL, 5)
         
         self.browse_path_btn = wx.Button(self.download_panel, label="Browse...")
@@ -1270,13 +1859,14 @@ class EcosysAPICurator(wx.Frame):
         self.url_text.SetValue("https://ecosis.org")
         
         # Load saved configuration if exists
-        config_file = "ecosys_config.json"
-        if os.path.exists(config_file):
+        self.last_saved_config = None
+        if os.path.exists(CONFIG_FILE):
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+                with open(CONFIG_FILE, 'rb') as f:
+                    config = json_loads(f.read())
                     self.url_text.SetValue(config.get('base_url', 'https://ecosis.org'))
                     self.download_path.SetValue(config.get('download_path', os.path.expanduser("~/Downloads/EcoSISData")))
+                    self.last_saved_config = config
             except:
                 pass
         
@@ -1285,10 +1875,17 @@ class EcosysAPICurator(wx.Frame):
         self.all_organizations = set()
         self.all_themes = set()
         
+        # Sorted copies for the comboboxes, re-sorted only when the sets grow, and what each combobox lists
+        self.sorted_organizations = ()
+        self.sorted_themes = ()
+        self.org_choice_items = None
+        self.type_choice_items = None
+        
         # Initialize timers with None check
         self.search_timer = None
         self.resize_timer = None
         self.batch_status_timer = None
+        self.path_timer = None
         
         # Search timer to prevent too frequent filtering
         self.search_timer = wx.Timer(self)
@@ -1298,17 +1895,61 @@ class EcosysAPICurator(wx.Frame):
         self.resize_timer = wx.Timer(self)
         self.Bind(wx.EVT_TIMER, self.on_resize_timer, self.resize_timer)
         
+        # Download folder timer so a typed path is rescanned once, not per keystroke
+        self.path_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_path_timer, self.path_timer)
+        
         # Cache for spectral data to avoid reprocessing on resize
         self.cached_spectral_data = None
+        self.cached_spectral_dataset_id = None
+        self.spectral_collection = None
+        self.spectral_collection_source = None
+        
+        # Downsampled curves for the cached spectra: (source list, n_out, [(wavelengths, reflectance), ...])
+        self.plot_downsample_cache = None
         
-        # Track which datasets are available locally
-        self.local_datasets = set()
+        # Spectra files in the download folder: lowercase filename -> (filename, size)
+        self.local_index = {}
+        self.local_folder = ''
         
+        # (download folder, dataset title) -> resolved spectra file path (None if not local), valid for the current index
+        self.local_path_cache = {}
+        
+        # Catalog paging and the (search text, filters JSON) the loaded catalog was fetched with
+        self.page_size = 100
+        self.loaded_query = None
+        self.serialized_filters = (None, '[]')  # (repr of filters, filters JSON)
+        
+        # (base url, dataset id) -> parsed /api/spectra/stats payload, least recent first
+        self.stats_cache = OrderedDict()
+        
+        # Only the newest catalog request may touch the UI; older ones have their responses closed
+        self.catalog_request_id = 0
+        self.catalog_request_lock = threading.Lock()
+        self.catalog_responses = set()
+
+        # Shared HTTP session and bounded worker pool for the download queue
+        self.session = self.create_http_session()
+        self.download_executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS)
+        
+        # General worker pool for catalog and spectra requests triggered from the UI
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        
+        # Bounded pool for the spectra blocks of single-dataset downloads
+        self.block_executor = ThreadPoolExecutor(max_workers=SPECTRA_BLOCK_WORKERS)
+        self.download_progress_lock = threading.Lock()
+        self.downloads_completed = 0
+        self.download_progress_value = 0
+
+        # Cleared while the download queue is paused
+        self.download_resume_event = threading.Event()
+        self.download_resume_event.set()
+
         # Check for existing local data
         self.check_local_data()
 
-    def extract_photos_from_dataset(self, dataset):
-        """Extract photo URLs from dataset metadata and trigger immediate download"""
+    def extract_photos_from_dataset(self, dataset, download_folder):
+        """Extract photo URLs from dataset metadata and trigger immediate download into download_folder"""
         photos = []
         dataset_id = dataset.get('_id', '')
         
@@ -1360,13 +2001,13 @@ class EcosysAPICurator(wx.Frame):
             # Store photos for this dataset
             if photos:
                 self.dataset_photos[dataset_id] = photos
-                print(f"DEBUG: Found {len(photos)} photos for dataset {dataset_id}")
+                logger.debug("Found %s photos for dataset %s", len(photos), dataset_id)
                 
                 # Immediately start downloading photos in background
-                self.download_photos_for_dataset_immediate(dataset, photos)
+                self.download_photos_for_dataset_immediate(dataset, photos, download_folder)
                 
         except Exception as e:
-            print(f"DEBUG: Error extracting photos from dataset {dataset_id}: {e}")
+            logger.debug("Error extracting photos from dataset %s: %s", dataset_id, e)
             
         return photos
         
@@ -1397,7 +2038,7 @@ class EcosysAPICurator(wx.Frame):
                 
         return False
 
-    def download_photos_for_dataset_immediate(self, dataset, photos):
+    def download_photos_for_dataset_immediate(self, dataset, photos, download_folder):
         """Download photos immediately when detected - with progress tracking"""
         dataset_id = dataset.get('_id', '')
         
@@ -1407,9 +2048,10 @@ class EcosysAPICurator(wx.Frame):
                 return  # Already downloading
             self.active_photo_downloads.add(dataset_id)
         
+        download_path = os.path.join(download_folder, "photos", dataset_id)
+        
         def download_worker():
             try:
-                download_path = os.path.join(self.download_path.GetValue(), "photos", dataset_id)
                 os.makedirs(download_path, exist_ok=True)
                 
                 total_photos = len(photos)
@@ -1417,7 +2059,7 @@ class EcosysAPICurator(wx.Frame):
                 
                 for i, photo_info in enumerate(photos):
                     try:
-                        print(f"DEBUG: Downloading photo {i+1}/{total_photos} for dataset {dataset_id}")
+                        logger.debug("Downloading photo %s/%s for dataset %s", i+1, total_photos, dataset_id)
                         photo_info['download_status'] = 'downloading'
                         photo_info['download_progress'] = 0
                         
@@ -1431,8 +2073,8 @@ class EcosysAPICurator(wx.Frame):
                             'Upgrade-Insecure-Requests': '1'
                         }
                         
-                        response = requests.get(photo_info['url'], timeout=30, headers=headers, 
-                                              stream=True, allow_redirects=True)
+                        response = self.session.get(photo_info['url'], timeout=(API_TIMEOUT[0], 30), headers=headers,
+                                                    stream=True, allow_redirects=True)
                         
                         if response.status_code == 200:
                             # Get total size if available
@@ -1486,32 +2128,40 @@ class EcosysAPICurator(wx.Frame):
                                 
                                 completed_count += 1
                                 
-                                print(f"DEBUG: Successfully downloaded photo {i+1} for dataset {dataset_id} -> {filename} ({photo_info['file_size']} bytes)")
+                                logger.debug("Successfully downloaded photo %s for dataset %s -> %s (%s bytes)",
+                                             i+1, dataset_id, filename, photo_info['file_size'])
+                                
+                                # Decode the photo shown as primary here so selecting the dataset only wraps a bitmap
+                                if Image and self.find_primary_photo(photos) is photo_info:
+                                    try:
+                                        self.get_decoded_thumbnail(filepath, PRIMARY_PHOTO_SIZE)
+                                    except Exception as e:
+                                        logger.debug("Could not pre-decode photo %s: %s", filepath, e)
                             else:
-                                print(f"DEBUG: Download verification failed for photo {i+1} for dataset {dataset_id}")
+                                logger.debug("Download verification failed for photo %s for dataset %s", i+1, dataset_id)
                                 photo_info['download_status'] = 'failed_verification'
                                 
                         else:
-                            print(f"DEBUG: Failed to download photo {i+1} for dataset {dataset_id}: HTTP {response.status_code}")
+                            logger.debug("Failed to download photo %s for dataset %s: HTTP %s", i+1, dataset_id, response.status_code)
                             photo_info['download_status'] = f'failed_http_{response.status_code}'
                             
                     except requests.exceptions.Timeout:
-                        print(f"DEBUG: Timeout downloading photo {i+1} for dataset {dataset_id}")
+                        logger.debug("Timeout downloading photo %s for dataset %s", i+1, dataset_id)
                         photo_info['download_status'] = 'failed_timeout'
                     except requests.exceptions.ConnectionError:
-                        print(f"DEBUG: Connection error downloading photo {i+1} for dataset {dataset_id}")
+                        logger.debug("Connection error downloading photo %s for dataset %s", i+1, dataset_id)
                         photo_info['download_status'] = 'failed_connection'
                     except Exception as e:
-                        print(f"DEBUG: Error downloading photo {i+1} for dataset {dataset_id}: {e}")
+                        logger.debug("Error downloading photo %s for dataset %s: %s", i+1, dataset_id, e)
                         photo_info['download_status'] = 'failed_error'
                     
                     # Brief pause between downloads to be server-friendly
                     time.sleep(0.5)
                 
-                print(f"DEBUG: Photo download complete for dataset {dataset_id}: {completed_count}/{total_photos} successful")
+                logger.debug("Photo download complete for dataset %s: %s/%s successful", dataset_id, completed_count, total_photos)
                 
             except Exception as e:
-                print(f"DEBUG: Error in photo download worker for dataset {dataset_id}: {e}")
+                logger.debug("Error in photo download worker for dataset %s: %s", dataset_id, e)
             finally:
                 # Remove from active downloads
                 with self.photo_download_lock:
@@ -1533,33 +2183,11 @@ class EcosysAPICurator(wx.Frame):
             
             # Primary photo title
             primary_title = wx.StaticText(primary_panel, label="📸 Primary Photo")
-            primary_title.SetFont(wx.Font(11, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+            primary_title.SetFont(self._primary_title_font)
             primary_sizer.Add(primary_title, 0, wx.ALL, 5)
             
-            # Load and display image
-            img = Image.open(photo_info['local_path'])
-            
-            # Calculate size to fit in available space (max 320x240)
-            img_width, img_height = img.size
-            max_width, max_height = 320, 240
-            
-            # Calculate scaling factor
-            scale_w = max_width / img_width
-            scale_h = max_height / img_height
-            scale = min(scale_w, scale_h, 1.0)  # Don't upscale
-            
-            new_width = int(img_width * scale)
-            new_height = int(img_height * scale)
-            
-            # Resize image
-            img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Convert to wx.Image
-            wx_img = wx.Image(new_width, new_height)
-            wx_img.SetData(img_resized.convert('RGB').tobytes())
-            
-            # Create bitmap and display
-            bitmap = wx.Bitmap(wx_img)
+            # Load image scaled to fit in available space (max 320x240)
+            bitmap, (img_width, img_height) = self.get_photo_thumbnail(photo_info['local_path'], PRIMARY_PHOTO_SIZE)
             img_ctrl = wx.StaticBitmap(primary_panel, bitmap=bitmap)
             
             # Add border for better visual separation
@@ -1571,21 +2199,77 @@ class EcosysAPICurator(wx.Frame):
             file_size_kb = photo_info.get('file_size', 0) / 1024
             img_info = f"{img_width}x{img_height} pixels, {file_size_kb:.1f} KB"
             info_label = wx.StaticText(primary_panel, label=img_info)
-            info_label.SetFont(wx.Font(8, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL))
+            info_label.SetFont(self._caption_font)
             primary_sizer.Add(info_label, 0, wx.ALIGN_CENTER|wx.ALL, 2)
             
             primary_panel.SetSizer(primary_sizer)
             self.photo_panel_sizer.Add(primary_panel, 0, wx.EXPAND|wx.ALL, 5)
             
         except Exception as e:
-            print(f"DEBUG: Error displaying primary photo: {e}")
+            logger.debug("Error displaying primary photo: %s", e)
             error_label = wx.StaticText(self.photo_scroll, label="Error loading primary photo")
             self.photo_panel_sizer.Add(error_label, 0, wx.ALL, 5)
 
+    def find_primary_photo(self, photos):
+        """First downloaded photo whose file still exists, i.e. the one display_primary_photo shows, or None"""
+        for photo in photos:
+            if (photo.get('download_status') == 'completed' and 
+                photo.get('local_path') and 
+                os.path.exists(photo.get('local_path'))):
+                return photo
+        return None
+        
+    def photo_thumbnail_key(self, path, max_size):
+        """Cache key for a photo thumbnail; a rewritten file gets a new key"""
+        stat = os.stat(path)
+        return (path, stat.st_mtime_ns, stat.st_size, max_size)
+        
+    def get_photo_thumbnail(self, path, max_size):
+        """Return (bitmap, original size) for a photo, decoding and wrapping each file only once"""
+        key = self.photo_thumbnail_key(path, max_size)
+        cached = self.photo_bitmap_cache.get(key)
+        if cached is not None:
+            self.photo_bitmap_cache.move_to_end(key)
+            return cached
+        
+        width, height, rgb, original_size = self.get_decoded_thumbnail(path, max_size, key)
+        thumbnail = (wx.Bitmap.FromBuffer(width, height, rgb), original_size)
+        self.photo_bitmap_cache[key] = thumbnail
+        if len(self.photo_bitmap_cache) > PHOTO_CACHE_SIZE:
+            self.photo_bitmap_cache.popitem(last=False)
+        return thumbnail
+        
+    def get_decoded_thumbnail(self, path, max_size, key=None):
+        """Return (width, height, RGB bytes, original size) for a photo through the thumbnail LRU (any thread)"""
+        if key is None:
+            key = self.photo_thumbnail_key(path, max_size)
+        
+        with self.photo_thumbnail_lock:
+            cached = self.photo_thumbnail_cache.get(key)
+            if cached is not None:
+                self.photo_thumbnail_cache.move_to_end(key)
+                return cached
+        
+        # Decoded outside the lock; PIL releases the GIL while decoding and resampling
+        with Image.open(path) as img:
+            original_size = img.size
+            # JPEG can decode straight at a reduced scale; thumbnail() then finishes with LANCZOS
+            img.draft('RGB', max_size)
+            thumb = img.convert('RGB')
+            thumb.thumbnail(max_size, Image.Resampling.LANCZOS)  # Don't upscale
+        decoded = (thumb.width, thumb.height, thumb.tobytes(), original_size)
+        
+        with self.photo_thumbnail_lock:
+            self.photo_thumbnail_cache[key] = decoded
+            if len(self.photo_thumbnail_cache) > PHOTO_CACHE_SIZE:
+                self.photo_thumbnail_cache.popitem(last=False)
+        
+        return decoded
+
     def display_photo_list(self, photos):
         """Display compact list of all photos with progress indicators"""
         list_title = wx.StaticText(self.photo_scroll, label="All Photos:")
-        list_title.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        list_title.SetFont(self._heading_font)
         self.photo_panel_sizer.Add(list_title, 0, wx.ALL, 5)
         
         for i, photo_info in enumerate(photos):
@@ -1597,24 +2281,24 @@ class EcosysAPICurator(wx.Frame):
             status = photo_info.get('download_status', 'unknown')
             if status == 'completed':
                 status_symbol = "✓"
-                status_color = wx.Colour(0, 150, 0)
+                status_color = self._photo_status_colours['completed']
             elif status == 'downloading':
                 progress = photo_info.get('download_progress', 0)
                 status_symbol = f"⬇{progress}%"
-                status_color = wx.Colour(0, 100, 200)
+                status_color = self._photo_status_colours['downloading']
             elif status == 'pending':
                 status_symbol = "⏳"
-                status_color = wx.Colour(150, 150, 0)
+                status_color = self._photo_status_colours['pending']
             elif status.startswith('failed_'):
                 status_symbol = "✗"
-                status_color = wx.Colour(200, 0, 0)
+                status_color = self._photo_status_colours['failed']
             else:
                 status_symbol = "?"
-                status_color = wx.Colour(100, 100, 100)
+                status_color = self._photo_status_colours['unknown']
             
             status_label = wx.StaticText(photo_panel, label=status_symbol)
             status_label.SetForegroundColour(status_color)
-            status_label.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+            status_label.SetFont(self._heading_font)
             photo_sizer.Add(status_label, 0, wx.ALIGN_CENTER_VERTICAL|wx.ALL, 5)
             
             # Photo info with file details
@@ -1631,7 +2315,7 @@ class EcosysAPICurator(wx.Frame):
                 info_text += f" (downloading...)"
             
             info_label = wx.StaticText(photo_panel, label=info_text)
-            info_label.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
+            info_label.SetFont(self._body_font)
             photo_sizer.Add(info_label, 1, wx.ALIGN_CENTER_VERTICAL|wx.ALL, 5)
             
             # Action button
@@ -1668,7 +2352,7 @@ class EcosysAPICurator(wx.Frame):
         
         # Update label
         self.photo_label = wx.StaticText(self.photo_scroll, label=f"Photos for: {dataset_title}")
-        self.photo_label.SetFont(wx.Font(10, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD))
+        self.photo_label.SetFont(self._heading_font)
         self.photo_panel_sizer.Add(self.photo_label, 0, wx.ALL, 10)
         
         # Check if we have photos for this dataset
@@ -1676,7 +2360,7 @@ class EcosysAPICurator(wx.Frame):
         
         if not photos:
             no_photos_label = wx.StaticText(self.photo_scroll, label="No photos available for this dataset")
-            no_photos_label.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL))
+            no_photos_label.SetFont(self._note_font)
             self.photo_panel_sizer.Add(no_photos_label, 0, wx.ALIGN_CENTER|wx.ALL, 10)
         else:
             # Display status and first available photo prominently
@@ -1694,17 +2378,11 @@ class EcosysAPICurator(wx.Frame):
                 status_text += f", {status_counts['pending']} pending"
                 
             status_label = wx.StaticText(self.photo_scroll, label=status_text)
-            status_label.SetFont(wx.Font(9, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_ITALIC, wx.FONTWEIGHT_NORMAL))
+            status_label.SetFont(self._note_font)
             self.photo_panel_sizer.Add(status_label, 0, wx.ALL, 5)
             
             # Find and display the first successfully downloaded photo prominently
-            first_downloaded_photo = None
-            for photo in photos:
-                if (photo.get('download_status') == 'completed' and 
-                    photo.get('local_path') and 
-                    os.path.exists(photo.get('local_path'))):
-                    first_downloaded_photo = photo
-                    break
+            first_downloaded_photo = self.find_primary_photo(photos)
             
             if first_downloaded_photo:
                 self.display_primary_photo(first_downloaded_photo)
@@ -1735,9 +2413,19 @@ class EcosysAPICurator(wx.Frame):
             'download_path': self.download_path.GetValue(),
             'environment': self.env_choice.GetSelection()
         }
+        # Nothing to write if the settings match what is already on disk
+        if config == self.last_saved_config:
+            return
+        
         try:
-            with open("ecosys_config.json", 'w') as f:
-                json.dump(config, f, indent=2)
+            data = json_dumps(config, indent=True)
+            
+            # Write a temp file and swap it in so a crash never leaves a truncated config
+            temp_file = CONFIG_FILE + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+            os.replace(temp_file, CONFIG_FILE)
+            self.last_saved_config = config
         except:
             pass
     
@@ -1760,8 +2448,9 @@ class EcosysAPICurator(wx.Frame):
         
         # Organization filter - now using ComboBox
         organization = self.org_choice.GetValue().strip()
-        if organization:
-            filters.append({"Organization": {"$regex": organization, "$options": "i"}})
+        if organization and organization.lower() != "all":
+            # Escaped so names such as "... (JPL)" match themselves rather than act as a pattern
+            filters.append({"Organization": {"$regex": re.escape(organization), "$options": "i"}})
         
         # Date filters (if provided)
         date_from = self.date_from.GetValue().strip()
@@ -1792,6 +2481,15 @@ class EcosysAPICurator(wx.Frame):
         return filters
 
     # Event handlers
+    def serialize_filters(self, filters):
+        """Filters JSON as sent to the API, re-serialized only when the filters change"""
+        key = repr(filters)
+        cached_key, filters_json = self.serialized_filters
+        if key != cached_key:
+            filters_json = json.dumps(filters) if filters else '[]'
+            self.serialized_filters = (key, filters_json)
+        return filters_json
+        
     def on_connect(self, event):
         """Connect to API and load initial data"""
         self.SetStatusText("Connecting to EcoSIS API...")
@@ -1799,202 +2497,228 @@ class EcosysAPICurator(wx.Frame):
         wx.CallAfter(self.load_api_data_threaded)
         
     def load_api_data_threaded(self):
-        """Load API data in a separate thread with safe callbacks"""
+        """Load API data on the worker pool with safe callbacks"""
         self.thread_safe_update_progress(0, "Connecting to API...")
-        loading_thread = threading.Thread(target=self.load_api_data)
-        loading_thread.daemon = True
-        loading_thread.start()
         
-    def load_api_data(self):
+        # Disable the load buttons until the catalog has been fetched
+        self.connect_btn.Disable()
+        self.refresh_btn.Disable()
+        
+        # Supersede any in-flight catalog request and abort its socket reads
+        request_id = self.cancel_catalog_request()
+        
+        # Controls are read here on the UI thread; the worker only sees plain values
+        base_url = self.url_text.GetValue().rstrip('/')
+        search_text = self.search_text.GetValue()
+        filters = self.build_filters()
+        download_folder = self.download_path.GetValue()
+        
+        future = self.executor.submit(self.load_api_data, base_url, search_text, filters, download_folder, request_id)
+        future.add_done_callback(lambda f: self.safe_call_after(self.on_api_data_loaded, request_id))
+        
+    def cancel_catalog_request(self):
+        """Supersede any in-flight catalog request, abort its socket reads, and return the new request id"""
+        with self.catalog_request_lock:
+            self.catalog_request_id += 1
+            for response in self.catalog_responses:
+                response.close()
+            self.catalog_responses.clear()
+            return self.catalog_request_id
+        
+    def on_api_data_loaded(self, request_id=None):
+        """Re-enable the load buttons once the newest catalog request finishes"""
+        if self.is_stale_catalog_request(request_id):
+            return
+        self.connect_btn.Enable()
+        self.refresh_btn.Enable()
+        
+    def is_stale_catalog_request(self, request_id):
+        """True when a newer catalog request has superseded request_id"""
+        return request_id is not None and request_id != self.catalog_request_id
+        
+    def load_api_data(self, base_url, search_text, filters, download_folder, request_id=None):
         """Load all data from EcoSIS API without pagination"""
         try:
-            base_url = self.url_text.GetValue().rstrip('/')
-            search_text = self.search_text.GetValue()
-            filters = self.build_filters()
-            
             # Build API URL for package search
             api_url = f"{base_url}/api/package/search"
             
             # Load all datasets in batches
             all_datasets = []
-            batch_size = 100  # Load in batches of 100
-            start = 0
+            batch_size = self.page_size
             
             self.safe_call_after(self.data_info.SetLabel, "Loading datasets...")
             self.safe_call_after(self.loading_gauge.SetValue, 0)
             
-            while True:
-                # Prepare query parameters for current batch
-                params = {
-                    'text': search_text,
-                    'filters': json.dumps(filters) if filters else '[]',
-                    'start': start,
-                    'stop': start + batch_size
-                }
-                
-                # Make API request
-                response = requests.get(api_url, params=params, timeout=30)
+            for status_code, data in self.iter_search_pages(api_url, search_text, filters, batch_size, request_id):
+                if self.is_stale_catalog_request(request_id):
+                    return  # A newer request owns the grid now
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get('items', [])
-                    
-                    if not items:
-                        break  # No more data
-                    
-                    # Extract photos from each dataset as we load them
-                    for dataset in items:
-                        self.extract_photos_from_dataset(dataset)
-                    
-                    all_datasets.extend(items)
-                    start += batch_size
-                    
-                    # Update progress
-                    total = data.get('total', len(all_datasets))
-                    progress = min(100, (len(all_datasets) * 100) // total) if total > 0 else 100
-                    self.thread_safe_update_progress(progress, f"Loaded {len(all_datasets)} of {total} datasets")
-                    
-                    # If we got fewer items than requested, we've reached the end
-                    if len(items) < batch_size:
-                        break
-                        
-                else:
-                    self.safe_call_after(self.SetStatusText, f"API Error: HTTP {response.status_code}")
+                if status_code != 200:
+                    self.safe_call_after(self.SetStatusText, f"API Error: HTTP {status_code}")
                     return
+                
+                items = data.get('items', [])
+                
+                if not items:
+                    break  # No more data
+                
+                # Extract photos from each dataset as we load them
+                # and format their static grid columns off the GUI thread
+                for dataset in items:
+                    self.extract_photos_from_dataset(dataset, download_folder)
+                    self.grid_table.row_cells(dataset)
+                self.flag_local_datasets(items)
+                
+                all_datasets.extend(items)
+                
+                # Show rows as pages arrive; the virtual grid only appends the new rows
+                self.filtered_data = DatasetView(all_datasets)
+                self.safe_call_after(self.update_data_grid)
+                
+                # Update progress
+                total = data.get('total', len(all_datasets))
+                progress = min(100, (len(all_datasets) * 100) // total) if total > 0 else 100
+                self.thread_safe_update_progress(progress, f"Loaded {len(all_datasets)} of {total} datasets")
+            
+            if self.is_stale_catalog_request(request_id):
+                return
             
             # Update data
             self.api_data = all_datasets
-            self.filtered_data = self.api_data.copy()
+            self.filtered_data = DatasetView(self.api_data)
+            self.build_search_index()
             self.total_datasets = len(all_datasets)
+            self.loaded_query = (search_text, self.serialize_filters(filters))
             
             # Collect organizations and themes
-            self.collect_organizations()
-            self.collect_themes()
+            self.collect_metadata()
             
             # Thread-safe updates
             self.safe_call_after(self.update_data_grid)
             self.safe_call_after(self.update_organization_combobox)
+            self.safe_call_after(self.reapply_local_filters)
             self.thread_safe_update_progress(100, f"Loaded {len(self.api_data)} datasets")
 
         except requests.RequestException as e:
+            if self.is_stale_catalog_request(request_id):
+                return  # Aborted by a newer request
             self.safe_call_after(self.SetStatusText, f"Connection error: {str(e)}")
             self.thread_safe_update_progress(0, "Connection error")
         except Exception as e:
+            if self.is_stale_catalog_request(request_id):
+                return
             self.safe_call_after(self.SetStatusText, f"Error: {str(e)}")
             self.thread_safe_update_progress(0, f"Error: {str(e)}")
 
-    def update_data_grid(self):
-        """Update the data grid with current EcoSIS data including checkboxes and highlighting"""
-        # Clear existing data
-        if self.data_grid.GetNumberRows() > 0:
-            self.data_grid.DeleteRows(0, self.data_grid.GetNumberRows())
-            
-        # Add new data
-        for i, dataset in enumerate(self.filtered_data):
-            self.data_grid.AppendRows(1)
-            
-            # Extract EcoSIS-specific data
-            ecosis_info = dataset.get('ecosis', {})
-            
-            # Column 0: Download checkbox
-            is_local = self.is_dataset_local(dataset)
-            self.data_grid.SetCellValue(i, 0, "1" if is_local else "0")
-            
-            # Column 1: ID
-            self.data_grid.SetCellValue(i, 1, str(dataset.get('_id', '')))
-            
-            # Column 2: Title - use ecosis.package_title or title
-            title = ecosis_info.get('package_title', '')
-            if not title:
-                title = ecosis_info.get('title', '')
-            if not title:
-                # Fallback to package_id if both are missing
-                title = ecosis_info.get('package_id', 'Unknown')
-            self.data_grid.SetCellValue(i, 2, str(title))
-            
-            # Column 3: Organization - handle both string and list properly
-            organization = ecosis_info.get('organization', [])
-            if isinstance(organization, list):
-                # Join list elements properly
-                org_str = ', '.join(str(org) for org in organization if org)
-            elif isinstance(organization, str):
-                org_str = organization
-            else:
-                org_str = 'Unknown'
-            self.data_grid.SetCellValue(i, 3, org_str)
-            
-            # Column 4: Spectra count
-            spectra_count = ecosis_info.get('spectra_count', 0)
-            self.data_grid.SetCellValue(i, 4, str(spectra_count))
-            
-            # Column 5: Keywords - use Keywords from main dataset
-            keywords = dataset.get('Keywords', [])
-            if not keywords:
-                # Fallback to ecosis.keyword if main Keywords is empty
-                keywords = ecosis_info.get('keyword', [])
-            
-            if isinstance(keywords, list):
-                keywords_str = ', '.join(str(kw) for kw in keywords[:3] if kw)  # Show first 3 keywords
-                if len(keywords) > 3:
-                    keywords_str += f'... ({len(keywords)} total)'
-            elif isinstance(keywords, str):
-                keywords_str = keywords
-            else:
-                keywords_str = ''
-            self.data_grid.SetCellValue(i, 5, keywords_str)
-            
-            # Column 6: Theme - use Theme from main dataset
-            theme_list = dataset.get('Theme', [])
-            if isinstance(theme_list, list):
-                theme_str = ', '.join(str(t) for t in theme_list[:2] if t)  # Show first 2 themes
-            elif isinstance(theme_list, str):
-                theme_str = theme_list
-            else:
-                # Fallback to Category if Theme is not available
-                category_list = dataset.get('Category', [])
-                if isinstance(category_list, list):
-                    theme_str = ', '.join(str(c) for c in category_list[:2] if c)
-                elif isinstance(category_list, str):
-                    theme_str = category_list
-                else:
-                    theme_str = ''
-            self.data_grid.SetCellValue(i, 6, theme_str)
-            
-            # Column 7: Status
-            status = "Downloaded" if is_local else "Available"
-            self.data_grid.SetCellValue(i, 7, status)
+    def iter_search_pages(self, api_url, search_text, filters, batch_size, request_id=None):
+        """Yield (status_code, data) for consecutive package search pages in order"""
+        filters_json = self.serialize_filters(filters)
+        
+        def fetch_page(start):
+            if self.is_stale_catalog_request(request_id):
+                return None, None  # Superseded; skip the round-trip
             
-            # Highlight row if data is available locally
-            if is_local:
-                self.highlight_local_row(i)
+            params = {
+                'text': search_text,
+                'filters': filters_json,
+                'start': start,
+                'stop': start + batch_size
+            }
+            # Streamed so a newer request can close the response mid-read; repeats are served by requests-cache
+            response = self.session.get(api_url, params=params, timeout=API_TIMEOUT, stream=True)
+            with self.catalog_request_lock:
+                self.catalog_responses.add(response)
+            try:
+                if response.status_code != 200:
+                    return response.status_code, None
+                data = json_loads(response.content)
+                return response.status_code, data
+            finally:
+                with self.catalog_request_lock:
+                    self.catalog_responses.discard(response)
+                response.close()
+        
+        # The first page tells us how many datasets match
+        status_code, data = fetch_page(0)
+        yield status_code, data
+        if status_code != 200:
+            return
+        
+        items = data.get('items', [])
+        total = data.get('total')
+        if len(items) < batch_size:
+            return
+        
+        if isinstance(total, int):
+            # Remaining page offsets are known, so overlap their round-trips
+            with ThreadPoolExecutor(max_workers=API_PAGE_WORKERS) as pool:
+                yield from pool.map(fetch_page, range(batch_size, total, batch_size))
+        else:
+            # Unknown total: walk pages until a short one comes back
+            start = batch_size
+            while True:
+                status_code, data = fetch_page(start)
+                yield status_code, data
+                if status_code != 200 or len(data.get('items', [])) < batch_size:
+                    return
+                start += batch_size
+
+    def update_data_grid(self):
+        """Resync the virtual grid with filtered_data; cells are rendered on demand by the table"""
+        # Existing rows are reused: only the row-count delta is sent, and the
+        # per-dataset _is_local flags survive filter changes (check_local_data restamps them)
+        table = self.grid_table
+        
+        old_rows = self.data_grid.GetNumberRows()
+        new_rows = table.GetNumberRows()
+        
+        self.data_grid.BeginBatch()
+        try:
+            if new_rows < old_rows:
+                msg = wx.grid.GridTableMessage(table, wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED,
+                                               new_rows, old_rows - new_rows)
+                self.data_grid.ProcessTableMessage(msg)
+            elif new_rows > old_rows:
+                msg = wx.grid.GridTableMessage(table, wx.grid.GRIDTABLE_NOTIFY_ROWS_APPENDED,
+                                               new_rows - old_rows)
+                self.data_grid.ProcessTableMessage(msg)
+        finally:
+            self.data_grid.EndBatch()
+        
+        self.data_grid.ForceRefresh()
         
     def check_local_data(self):
         """Check which datasets' spectral JSON files are available locally"""
         download_path = self.download_path.GetValue()
         
-        if not os.path.exists(download_path):
-            return
-            
-        self.local_datasets = set()  # Reset the set
+        local_index = {}
         
-        try:
-            for filename in os.listdir(download_path):
-                if filename.startswith('spectra_') and filename.endswith('.json'):
-                    # Extract dataset name from filename
-                    dataset_name = filename[8:-5]  # Remove 'spectra_' and '.json'
-                    
-                    # Store both the clean filename version and various title variations
-                    self.local_datasets.add(dataset_name)
-                    
-                    # Convert underscores back to spaces for matching
-                    dataset_name_spaced = dataset_name.replace('_', ' ')
-                    self.local_datasets.add(dataset_name_spaced)
-                    
-                    # Also store the original filename without extension for exact matching
-                    self.local_datasets.add(filename[:-5])  # Remove just .json
-                    
-        except OSError as e:
-            print(f"DEBUG: Error scanning directory: {e}")
+        if os.path.exists(download_path):
+            try:
+                # Single directory scan; names are filtered before any size lookup
+                with os.scandir(download_path) as entries:
+                    for entry in entries:
+                        filename = entry.name
+                        if filename.startswith('spectra_') and filename.endswith('.json'):
+                            local_index[filename.lower()] = (filename, entry.stat().st_size)
+                        
+            except OSError as e:
+                logger.debug("Error scanning directory: %s", e)
+        
+        self.local_index = local_index
+        self.local_folder = download_path
+        self.local_path_cache = {}
+        self.flag_local_datasets(self.api_data)
+        
+        # Download statuses and ticks from before the rescan would hide the new local flags
+        if hasattr(self, 'grid_table'):
+            for dataset in self.api_data:
+                self.grid_table.clear_status(dataset)
+        
+        # Local availability may have changed, so repaint the grid from the new flags
+        if hasattr(self, 'grid_table'):
+            self.grid_table.reset()
+            self.data_grid.ForceRefresh()
         
     def on_grid_cell_click(self, event):
         """Handle grid cell clicks, especially for checkbox column"""
@@ -2016,17 +2740,13 @@ class EcosysAPICurator(wx.Frame):
             # For other columns, handle normal selection
             if 0 <= row < len(self.filtered_data):
                 dataset = self.filtered_data[row]
-                self.current_selection = dataset
-                
-                # Check if local data exists
-                is_local = self.is_dataset_local(dataset)
-                
-                self.update_metadata_display()
-                title = self.current_selection.get('ecosis', {}).get('package_title', 'Unknown')
-                self.selection_info.SetLabel(f"Selected: {title}")
-                
-                # Automatically display photos for the selected dataset
-                wx.CallAfter(self.display_photos_for_dataset, dataset)
+                if dataset is not self.current_selection:
+                    self.current_selection = dataset
+                    title = self.current_selection.get('ecosis', {}).get('package_title', 'Unknown')
+                    self.selection_info.SetLabel(f"Selected: {title}")
+                    
+                    # Rendered once the selection settles, as in on_grid_select
+                    self.selection_dirty = True
         
         event.Skip()
         
@@ -2035,16 +2755,31 @@ class EcosysAPICurator(wx.Frame):
         """Handle grid row selection with automatic photo display"""
         row = event.GetRow()
         if 0 <= row < len(self.filtered_data):
-            self.current_selection = self.filtered_data[row]
-            self.update_metadata_display()
+            dataset = self.filtered_data[row]
+            if dataset is self.current_selection:
+                return
+            
+            self.current_selection = dataset
             title = self.current_selection.get('ecosis', {}).get('package_title', 'Unknown')
             self.selection_info.SetLabel(f"Selected: {title}")
             
-            # Display photos automatically with first photo prominent
-            wx.CallAfter(self.display_photos_for_dataset, self.current_selection)
-
-    def on_refresh_photos(self, event):
-        """Refresh photos for the current selection"""
+            # Metadata and photos are rendered once the selection settles (see on_idle)
+            self.selection_dirty = True
+            
+    def on_idle(self, event):
+        """Render metadata and photos for the latest selection once the event queue is idle"""
+        event.Skip()
+        if not self.selection_dirty or self._destroyed:
+            return
+        self.selection_dirty = False
+        
+        if self.current_selection:
+            self.update_metadata_display()
+            # Display photos automatically with first photo prominent
+            self.display_photos_for_dataset(self.current_selection)
+
+    def on_refresh_photos(self, event):
+        """Refresh photos for the current selection"""
         if self.current_selection:
             self.display_photos_for_dataset(self.current_selection)
         else:
@@ -2066,7 +2801,7 @@ class EcosysAPICurator(wx.Frame):
                 elif system == "Linux":
                     subprocess.run(['xdg-open', btn.photo_path], check=False)
             except Exception as e:
-                print(f"DEBUG: Error opening photo: {e}")
+                logger.debug("Error opening photo: %s", e)
                 wx.MessageBox(f"Could not open photo:\n{str(e)}", "Error", wx.OK | wx.ICON_ERROR)
     
     def on_open_dataset_page(self, event):
@@ -2095,23 +2830,36 @@ class EcosysAPICurator(wx.Frame):
         # Update UI to show downloading
         self.data_grid.SetCellValue(row, 7, "Downloading...")  # Status column
         
-        # Start download in thread
+        # Start download in thread; the worker reports against the dataset, since its row moves with the filters
+        spectra_count = dataset.get('ecosis', {}).get('spectra_count')
+        base_url = self.url_text.GetValue().rstrip('/')
+        download_path = self.download_path.GetValue()
         download_thread = threading.Thread(target=self.download_spectral_json_worker, 
-                                         args=(dataset_id, title, row))
+                                         args=(dataset, title, base_url, download_path, spectra_count))
         download_thread.daemon = True
         download_thread.start()
         
     def normalize_filename(self, title):
         """Normalize dataset title for consistent filename generation"""
-        # Replace problematic characters consistently
-        clean_title = title.replace(' ', '_').replace('/', '_').replace('\\', '_')
-        return clean_title
+        # One translate pass; leading dots are stripped so a title can never name '..' or a hidden file
+        return title.translate(FILENAME_TRANSLATION).lstrip('.')[:MAX_FILENAME_TITLE]
     
-    def download_spectral_json_worker(self, dataset_id, title, row):
+    def fetch_spectra_block(self, spectra_url, start, stop):
+        """Fetch spectra start:stop of a dataset, returning (status_code, parsed response)"""
+        params = {
+            'start': start,
+            'stop': stop,
+            'filters': '[]'
+        }
+        response = self.session.get(spectra_url, params=params, timeout=(API_TIMEOUT[0], 60))
+        if response.status_code != 200:
+            return response.status_code, {}
+        return response.status_code, json_loads(response.content)
+        
+    def download_spectral_json_worker(self, dataset, title, base_url, download_path, spectra_count=None):
         """Worker thread for downloading complete spectral data in JSON format"""
+        dataset_id = dataset.get('_id')
         try:
-            base_url = self.url_text.GetValue().rstrip('/')
-            download_path = self.download_path.GetValue()
             os.makedirs(download_path, exist_ok=True)
             
             # Use consistent filename normalization
@@ -2119,162 +2867,183 @@ class EcosysAPICurator(wx.Frame):
             filename = f"spectra_{clean_title}.json"
             filepath = os.path.join(download_path, filename)
             
-            # Download all spectra in blocks of 10
-            all_spectra = []
+            # The file must land inside the download folder whatever the API returned as a title
+            root = os.path.realpath(download_path)
+            if not os.path.realpath(filepath).startswith(root + os.sep):
+                raise ValueError("path traversal")
+            
+            # Download all spectra in blocks of 10, streaming each block to a temp file
             block_size = 10
-            start = 0
             total_downloaded = 0
+            temp_filepath = filepath + '.part'
             
             wx.CallAfter(self.SetStatusText, f"Downloading spectra for: {title}")
             
-            while True:
-                # Get spectra block using EcoSIS API
-                spectra_url = f"{base_url}/api/spectra/search/{dataset_id}"
-                params = {
-                    'start': start,
-                    'stop': start + block_size,
-                    'filters': '[]'
-                }
-                
-                response = requests.get(spectra_url, params=params, timeout=60)
-                
-                if response.status_code == 200:
-                    spectra_data = response.json()
-                    items = spectra_data.get('items', [])
+            try:
+                with open(temp_filepath, 'wb') as f:
+                    # dataset_info goes first; total_spectra is a padded placeholder filled in at the end
+                    dataset_info = {
+                        'id': dataset_id,
+                        'title': title,
+                        'download_date': datetime.now().isoformat(),
+                        'source': 'EcoSIS API'
+                    }
+                    f.write(b'{\n  "dataset_info": ')
+                    f.write(json_dumps(dataset_info)[:-1])
+                    f.write(b', "total_spectra": ')
+                    total_offset = f.tell()
+                    f.write(b' ' * SPECTRA_TOTAL_WIDTH)
+                    f.write(b'},\n  "spectra": [\n')
                     
-                    if not items:
-                        break  # No more spectra to download
+                    # Get the first spectra block using EcoSIS API
+                    spectra_url = f"{base_url}/api/spectra/search/{dataset_id}"
+                    status, spectra_data = self.fetch_spectra_block(spectra_url, 0, block_size)
+                    start = block_size
                     
-                    all_spectra.extend(items)
-                    total_downloaded += len(items)
-                    start += block_size
+                    # Once the total is known, the remaining blocks are fetched through a sliding window
+                    pending = deque()
+                    block_starts = iter(())
+                    if status == 200:
+                        total = int(spectra_data.get('total') or spectra_count or 0)
+                        block_starts = iter(range(block_size, total, block_size))
+                        for block_start in itertools.islice(block_starts, SPECTRA_BLOCK_WINDOW):
+                            pending.append(self.block_executor.submit(self.fetch_spectra_block, spectra_url,
+                                                                      block_start, block_start + block_size))
                     
-                    # Update progress
-                    wx.CallAfter(self.data_grid.SetCellValue, row, 7, f"Downloaded {total_downloaded}")
-                    wx.CallAfter(self.SetStatusText, f"Downloaded {total_downloaded} spectra for: {title}")
+                    try:
+                        while status == 200:
+                            items = spectra_data.get('items', [])
+                            
+                            if not items:
+                                break  # No more spectra to download
+                            
+                            # One spectrum per line, written in block order as each block arrives
+                            for item in items:
+                                if total_downloaded:
+                                    f.write(b',\n')
+                                f.write(json_dumps(item))
+                                total_downloaded += 1
+                            
+                            # Update progress
+                            wx.CallAfter(self.set_dataset_status, dataset, f"Downloaded {total_downloaded}")
+                            wx.CallAfter(self.SetStatusText, f"Downloaded {total_downloaded} spectra for: {title}")
+                            
+                            # If we got fewer items than requested, we've reached the end
+                            if len(items) < block_size:
+                                break
+                            
+                            # Blocks past the advertised total are fetched one at a time
+                            if pending:
+                                status, spectra_data = pending.popleft().result()
+                                # Refill the window as each block is consumed
+                                for block_start in itertools.islice(block_starts, 1):
+                                    pending.append(self.block_executor.submit(self.fetch_spectra_block, spectra_url,
+                                                                              block_start, block_start + block_size))
+                            else:
+                                status, spectra_data = self.fetch_spectra_block(spectra_url, start, start + block_size)
+                            start += block_size
+                    finally:
+                        for future in pending:
+                            future.cancel()
                     
-                    # If we got fewer items than requested, we've reached the end
-                    if len(items) < block_size:
-                        break
-                        
-                else:
-                    wx.CallAfter(self.data_grid.SetCellValue, row, 7, f"Error: HTTP {response.status_code}")
-                    return
+                    if status != 200:
+                        wx.CallAfter(self.set_dataset_status, dataset, f"Error: HTTP {status}")
+                    
+                    f.write(b'\n  ]\n}\n')
+                    f.seek(total_offset)
+                    f.write(str(total_downloaded).encode('ascii').ljust(SPECTRA_TOTAL_WIDTH))
+                    
+                    complete = status == 200
+                    
+            except BaseException:
+                if os.path.exists(temp_filepath):
+                    os.remove(temp_filepath)
+                raise
             
-            if all_spectra:
-                # Create comprehensive JSON structure
-                complete_data = {
-                    'dataset_info': {
-                        'id': dataset_id,
-                        'title': title,
-                        'download_date': datetime.now().isoformat(),
-                        'total_spectra': len(all_spectra),
-                        'source': 'EcoSIS API'
-                    },
-                    'spectra': all_spectra
-                }
-                
-                # Save JSON file
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(complete_data, f, indent=2)
-                
-                print(f"DEBUG: Saved {len(all_spectra)} spectra to {filepath}")
+            if complete and total_downloaded:
+                os.replace(temp_filepath, filepath)
                 
-                # Update local datasets tracking immediately after successful download
-                wx.CallAfter(self.check_local_data)  # Refresh the local datasets list
+                logger.debug("Saved %s spectra to %s", total_downloaded, filepath)
                 
-                # Update UI
-                wx.CallAfter(self.data_grid.SetCellValue, row, 0, "1")  # Check the checkbox
-                wx.CallAfter(self.data_grid.SetCellValue, row, 7, f"Complete ({total_downloaded})")
-                wx.CallAfter(self.highlight_local_row, row)
+                # The GUI thread records just this file in the local index instead of rescanning the folder
+                wx.CallAfter(self.mark_dataset_downloaded, dataset, f"Complete ({total_downloaded})",
+                             download_path, filename, os.path.getsize(filepath))
                 wx.CallAfter(self.SetStatusText, f"Downloaded {total_downloaded} spectra: {title}")
                 
             else:
-                wx.CallAfter(self.data_grid.SetCellValue, row, 7, "No spectra found")
+                os.remove(temp_filepath)
+                if complete:
+                    wx.CallAfter(self.set_dataset_status, dataset, "No spectra found")
                 
         except Exception as e:
             error_msg = f"Error: {str(e)[:20]}"
-            wx.CallAfter(self.data_grid.SetCellValue, row, 7, error_msg)
+            wx.CallAfter(self.set_dataset_status, dataset, error_msg)
             wx.CallAfter(self.SetStatusText, f"Download failed: {title}")
             
+    def local_index_key(self, title):
+        """Canonical local_index key for a dataset title: its normalized spectra filename, lowercased"""
+        return f"spectra_{self.normalize_filename(title)}.json".lower()
+        
+    def legacy_index_key(self, title):
+        """local_index key under the original naming, which only replaced spaces and slashes"""
+        legacy_title = title.replace(' ', '_').replace('/', '_').replace('\\', '_')
+        return f"spectra_{legacy_title}.json".lower()
+        
+    def resolve_local_path(self, title):
+        """Path of a title's downloaded spectra file, or None; memoized until the local index changes"""
+        cache_key = (self.local_folder, title)
+        if cache_key in self.local_path_cache:
+            return self.local_path_cache[cache_key]
+        
+        # The scandir index maps the canonical key to the file's actual on-disk name and size
+        record = self.local_index.get(self.local_index_key(title))
+        if record is None:
+            # Files downloaded before titles were fully sanitized keep their older, looser names
+            record = self.local_index.get(self.legacy_index_key(title))
+        if record is not None and record[1] > 100:
+            filepath = os.path.join(self.local_folder, record[0])
+        else:
+            filepath = None
+        self.local_path_cache[cache_key] = filepath
+        return filepath
+        
+    def forget_local_file(self, dataset, title):
+        """Drop a title's spectra file from the local index and show its dataset as remote again"""
+        self.local_index.pop(self.local_index_key(title), None)
+        self.local_index.pop(self.legacy_index_key(title), None)
+        self.local_path_cache.pop((self.local_folder, title), None)
+        dataset['_is_local'] = False
+        self.grid_table.reset()
+        self.data_grid.ForceRefresh()
+        
+    def flag_local_datasets(self, datasets):
+        """Stamp each dataset with _is_local from the local file index"""
+        for dataset in datasets:
+            title = dataset.get('ecosis', {}).get('package_title', '')
+            dataset['_is_local'] = bool(title) and self.resolve_local_path(title) is not None
+            
     def is_dataset_local(self, dataset):
         """Check if a dataset's spectral JSON is available locally"""
         if not dataset:
             return False
-            
-        download_path = self.download_path.GetValue()
-        title = dataset.get('ecosis', {}).get('package_title', '')
-        
-        if not title:
-            return False
-            
-        # Use consistent filename normalization
-        clean_title = self.normalize_filename(title)
-        filename = f"spectra_{clean_title}.json"
-        filepath = os.path.join(download_path, filename)
-        
-        # Check what files actually exist
-        try:
-            existing_files = [f for f in os.listdir(download_path) if f.startswith('spectra_') and f.endswith('.json')]
-            
-            # Check for exact match first
-            if filename in existing_files:
-                file_size = os.path.getsize(filepath)
-                return file_size > 100
-            
-            # Check for case variations or other close matches
-            for existing_file in existing_files:
-                if existing_file.lower() == filename.lower():
-                    alt_filepath = os.path.join(download_path, existing_file)
-                    file_size = os.path.getsize(alt_filepath)
-                    return file_size > 100
-                    
-        except OSError as e:
-            print(f"DEBUG: Error listing directory: {e}")
-        
-        return False
+        return dataset.get('_is_local', False)
         
     def load_spectral_data_local(self, dataset):
-        """Load spectral data from local JSON file"""
+        """Load spectral data from local JSON file; runs on the GUI thread, so errors are shown as modal dialogs"""
         try:
-            download_path = self.download_path.GetValue()
             title = dataset.get('ecosis', {}).get('package_title', 'Unknown')
             
-            # Use consistent filename normalization
-            clean_title = self.normalize_filename(title)
-            filename = f"spectra_{clean_title}.json"
-            filepath = os.path.join(download_path, filename)
-            
-            # List existing files for debugging and find actual file
-            actual_filepath = None
-            try:
-                existing_files = [f for f in os.listdir(download_path) if f.startswith('spectra_') and f.endswith('.json')]
-                
-                # Try exact match first
-                if filename in existing_files:
-                    actual_filepath = filepath
-                else:
-                    # Try case-insensitive match
-                    for existing_file in existing_files:
-                        if existing_file.lower() == filename.lower():
-                            actual_filepath = os.path.join(download_path, existing_file)
-                            break
-                            
-            except OSError as e:
-                print(f"DEBUG: Error listing directory: {e}")
-            
-            if not actual_filepath or not os.path.exists(actual_filepath):
+            # Resolved from the scandir index (size already checked) without touching the disk
+            actual_filepath = self.resolve_local_path(title)
+            if actual_filepath is None:
                 return False
-                
-            # Check file size first
-            file_size = os.path.getsize(actual_filepath)
-            
-            if file_size < 100:
+            if not os.path.exists(actual_filepath):
+                # Deleted outside the app since the folder was scanned; let the caller use the API
+                self.forget_local_file(dataset, title)
                 return False
                 
-            # Read JSON file
-            with open(actual_filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Read dataset info and the spectra that will be plotted
+            data = self.read_local_spectra(actual_filepath, LOCAL_PLOT_SPECTRA)
             
             # Process local JSON data into spectral format
             spectral_data = self.process_local_json_data(data, title)
@@ -2282,6 +3051,7 @@ class EcosysAPICurator(wx.Frame):
             if spectral_data:
                 # Cache the local data
                 self.cached_spectral_data = spectral_data
+                self.cached_spectral_dataset_id = dataset.get('_id')
                 
                 # Plot the cached data
                 self.plot_cached_spectral_data()
@@ -2294,16 +3064,58 @@ class EcosysAPICurator(wx.Frame):
                 wx.MessageBox("No spectral data found in local file", "No Data", wx.OK | wx.ICON_WARNING)
                 return False
                 
-        except json.JSONDecodeError as e:
+        except JSON_DECODE_ERRORS as e:
             wx.MessageBox(f"Invalid JSON file: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
             return False
         except FileNotFoundError as e:
-            wx.MessageBox(f"File not found: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
+            logger.debug("Local spectra file vanished: %s", e)
+            self.forget_local_file(dataset, title)
             return False
         except Exception as e:
             wx.MessageBox(f"Error loading local data: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
             return False
             
+    def read_local_spectra(self, filepath, max_spectra):
+        """Read dataset_info and the first max_spectra spectra of a local spectra file"""
+        # Files written by download_spectral_json_worker only need their first lines read
+        data = self.read_streamed_spectra(filepath, max_spectra)
+        if data is not None:
+            return data
+        
+        if ijson is None:
+            with open(filepath, 'rb') as f:
+                return json_loads(f.read())
+        
+        # Stream the file so only the spectra we keep are ever materialized
+        with open(filepath, 'rb') as f:
+            dataset_info = next(ijson.items(f, 'dataset_info', use_float=True), {})
+        with open(filepath, 'rb') as f:
+            spectra = list(itertools.islice(ijson.items(f, 'spectra.item', use_float=True), max_spectra))
+        
+        return {'dataset_info': dataset_info, 'spectra': spectra}
+        
+    def read_streamed_spectra(self, filepath, max_spectra):
+        """Read the header and first spectra of a one-spectrum-per-line download, or None for other layouts"""
+        info_prefix = b'"dataset_info": '
+        with open(filepath, 'rb') as f:
+            if f.readline().strip() != b'{':
+                return None
+            header = f.readline().strip()
+            if not header.startswith(info_prefix) or not header.endswith(b'},'):
+                return None
+            if f.readline().strip() != b'"spectra": [':
+                return None
+            
+            dataset_info = json_loads(header[len(info_prefix):-1])
+            spectra = []
+            for line in f:
+                line = line.strip()
+                if not line or line == b']' or len(spectra) >= max_spectra:
+                    break
+                spectra.append(json_loads(line.rstrip(b',')))
+        
+        return {'dataset_info': dataset_info, 'spectra': spectra}
+        
     def process_local_json_data(self, data, title):
         """Process local JSON data into spectral format"""
         spectral_data = []
@@ -2314,8 +3126,8 @@ class EcosysAPICurator(wx.Frame):
             if not spectra_items:
                 return []
             
-            # Process up to 15 spectra for visualization
-            for i, spectrum in enumerate(spectra_items[:15]):
+            # Process up to LOCAL_PLOT_SPECTRA spectra for visualization
+            for i, spectrum in enumerate(spectra_items[:LOCAL_PLOT_SPECTRA]):
                 if not isinstance(spectrum, dict):
                     continue
                     
@@ -2324,173 +3136,144 @@ class EcosysAPICurator(wx.Frame):
                 if not datapoints:
                     continue
                 
-                # Separate wavelengths from other metadata
-                spectrum_wavelengths = []
-                spectrum_reflectance = []
-                
-                for key, value in datapoints.items():
-                    try:
-                        # Check if key looks like a wavelength (numeric)
-                        wavelength = float(key)
-                        if 300 <= wavelength <= 2500:  # Typical spectral range
-                            spectrum_wavelengths.append(wavelength)
-                            
-                            # Handle various value formats
-                            if isinstance(value, (int, float)):
-                                refl_value = float(value)
-                            else:
-                                refl_value = float(str(value))
-                            spectrum_reflectance.append(refl_value)
-                            
-                    except (ValueError, TypeError):
-                        continue
+                # Separate wavelengths from other metadata, sorted by wavelength
+                wavelengths, reflectance = extract_spectrum(datapoints)
                 
-                if spectrum_wavelengths and spectrum_reflectance:
-                    # Sort by wavelength
-                    sorted_data = sorted(zip(spectrum_wavelengths, spectrum_reflectance))
-                    if sorted_data:
-                        wavelengths, reflectance = zip(*sorted_data)
-                        
-                        # Create meaningful legend label
-                        label = self.create_spectrum_label(spectrum, i + 1)
-                        
-                        spectral_data.append({
-                            'wavelengths': wavelengths,
-                            'reflectance': reflectance,
-                            'label': label,
-                            'color_index': len(spectral_data)
-                        })
+                if len(wavelengths):
+                    # Create meaningful legend label
+                    label = self.create_spectrum_label(spectrum, i + 1)
+                    
+                    spectral_data.append({
+                        'wavelengths': wavelengths,
+                        'reflectance': reflectance,
+                        'label': label,
+                        'color_index': len(spectral_data)
+                    })
                         
         except Exception as e:
-            print(f"DEBUG: process_local_json_data - Exception: {e}")
+            logger.debug("process_local_json_data - Exception: %s", e)
             return []
             
         return spectral_data
           
-    def highlight_local_row(self, row):
-        """Highlight a row that has local data available with dark mode support"""
-        # Check for dark mode and use appropriate colors
-        if wx.SystemSettings.GetAppearance().IsDark():
-            # Dark mode: subtle dark blue highlight
-            highlight_color = wx.Colour(45, 55, 80)  # Dark blue-gray
+    def set_dataset_status(self, dataset, status):
+        """Set a dataset's Status cell, repainting its current row if it is shown"""
+        row = self.grid_table.row_of(dataset)
+        if row is None:
+            self.grid_table.set_status(dataset, status)
         else:
-            # Light mode: light blue highlight
-            highlight_color = wx.Colour(230, 240, 255)  # Light blue
-            
-        # Set background color for all columns in the row
-        for col in range(self.data_grid.GetNumberCols()):
-            self.data_grid.SetCellBackgroundColour(row, col, highlight_color)
-        
-        self.data_grid.Refresh()
-        
-    def collect_organizations(self):
-        """Collect unique organizations from current dataset"""
+            self.data_grid.SetCellValue(row, 7, status)
+        
+    def mark_dataset_downloaded(self, dataset, status, download_path, filename, file_size):
+        """Index a finished download and flag its dataset as local; its checkbox and highlight follow the flag"""
+        # A file saved to a folder other than the indexed one is picked up when that folder is scanned
+        if download_path == self.local_folder:
+            title = dataset.get('ecosis', {}).get('package_title', '')
+            self.local_index[filename.lower()] = (filename, file_size)
+            self.local_path_cache.pop((download_path, title), None)
+            # The grid table supplies the checkbox and highlight colour for datasets it knows are local
+            self.grid_table.mark_local(dataset)
+        self.grid_table.set_status(dataset, status)
+        self.data_grid.ForceRefresh()
+        
+    def collect_metadata(self):
+        """Collect unique organizations and themes (including categories) in one pass over the catalog"""
+        organizations = self.all_organizations
+        themes = self.all_themes
         for dataset in self.api_data:
-            ecosis_info = dataset.get('ecosis', {})
-            organization = ecosis_info.get('organization', [])
-            
-            if isinstance(organization, list):
-                for org in organization:
-                    if org and str(org).strip():
-                        self.all_organizations.add(str(org).strip())
-            elif isinstance(organization, str) and organization.strip():
-                self.all_organizations.add(organization.strip())
-    
-    def collect_themes(self):
-        """Collect unique themes from current dataset"""
-        for dataset in self.api_data:
-            theme_list = dataset.get('Theme', [])
-            if isinstance(theme_list, list):
-                for theme in theme_list:
-                    if theme and str(theme).strip():
-                        self.all_themes.add(str(theme).strip())
-            elif isinstance(theme_list, str) and theme_list.strip():
-                self.all_themes.add(theme_list.strip())
-                
-            # Also collect from Category field
-            category_list = dataset.get('Category', [])
-            if isinstance(category_list, list):
-                for category in category_list:
-                    if category and str(category).strip():
-                        self.all_themes.add(str(category).strip())
-            elif isinstance(category_list, str) and category_list.strip():
-                self.all_themes.add(category_list.strip())
+            organizations.update(iter_stripped_strings(dataset.get('ecosis', {}).get('organization')))
+            themes.update(iter_stripped_strings(dataset.get('Theme')))
+            themes.update(iter_stripped_strings(dataset.get('Category')))
+        
+        # The sets only ever grow, so a size change means new entries to sort in
+        if len(organizations) != len(self.sorted_organizations):
+            self.sorted_organizations = tuple(sorted(organizations))
+        if len(themes) != len(self.sorted_themes):
+            self.sorted_themes = tuple(sorted(themes))
                 
     def update_organization_combobox(self):
         """Update organization combobox with collected organizations"""
-        # Clear existing items
-        self.org_choice.Clear()
+        sorted_orgs = self.sorted_organizations
+        if sorted_orgs is self.org_choice_items:
+            return  # Already listing exactly these organizations
+        self.org_choice_items = sorted_orgs
         
-        # Add "All" option
-        self.org_choice.Append("All")
+        # Keep the organization the catalog was filtered by
+        current_value = self.org_choice.GetValue().strip()
         
-        # Add sorted organizations
-        sorted_orgs = sorted(list(self.all_organizations))
-        for org in sorted_orgs:
-            self.org_choice.Append(org)
-        
-        # Set to "All" by default
-        self.org_choice.SetSelection(0)
+        # Replace the items with "All" plus the sorted organizations in one native call
+        self.org_choice.Freeze()
+        try:
+            self.org_choice.Set(["All", *sorted_orgs])
+            
+            # Restore previous value, otherwise set to "All"
+            if current_value and current_value.lower() != "all":
+                self.org_choice.SetValue(current_value)
+            else:
+                self.org_choice.SetSelection(0)
+        finally:
+            self.org_choice.Thaw()
         
     def update_theme_combobox(self):
         """Update theme combobox with collected themes"""
+        sorted_themes = self.sorted_themes
+        if sorted_themes is self.type_choice_items:
+            return  # Already listing exactly these themes
+        self.type_choice_items = sorted_themes
+        
         # Get current selection
         current_selection = self.type_choice.GetStringSelection()
         
-        # Clear existing items
-        self.type_choice.Clear()
-        
-        # Add "All" option
-        self.type_choice.Append("All")
-        
-        # Add sorted themes
-        sorted_themes = sorted(list(self.all_themes))
-        for theme in sorted_themes:
-            self.type_choice.Append(theme)
-        
-        # Try to restore previous selection, otherwise set to "All"
-        if current_selection and current_selection in sorted_themes:
-            self.type_choice.SetStringSelection(current_selection)
-        else:
-            self.type_choice.SetSelection(0)  # "All"
+        # Replace the items with "All" plus the sorted themes in one native call
+        self.type_choice.Freeze()
+        try:
+            self.type_choice.Set(["All", *sorted_themes])
+            
+            # Try to restore previous selection, otherwise set to "All"
+            if current_selection and current_selection in sorted_themes:
+                self.type_choice.SetStringSelection(current_selection)
+            else:
+                self.type_choice.SetSelection(0)  # "All"
+        finally:
+            self.type_choice.Thaw()
         
     def update_metadata_display(self):
         """Update metadata display for selected EcoSIS dataset"""
         if not self.current_selection:
             return
             
-        # Format metadata for EcoSIS dataset
-        metadata_text = "EcoSIS Dataset Metadata:\n\n"
+        # Format metadata for EcoSIS dataset into one buffer, joined once at the end
+        parts = ["EcoSIS Dataset Metadata:\n\n"]
         
         # Dataset ID and basic info
-        metadata_text += f"Dataset ID: {self.current_selection.get('_id', 'Unknown')}\n\n"
+        parts.append(f"Dataset ID: {self.current_selection.get('_id', 'Unknown')}\n\n")
         
         # EcoSIS-specific information
         ecosis_info = self.current_selection.get('ecosis', {})
         if ecosis_info:
-            metadata_text += "Dataset Information:\n"
+            parts.append("Dataset Information:\n")
             for key, value in ecosis_info.items():
                 if isinstance(value, list):
-                    value_str = ', '.join(str(v) for v in value)
+                    value_str = ', '.join(map(str, value))
                 else:
                     value_str = str(value)
-                metadata_text += f"  {key.title().replace('_', ' ')}: {value_str}\n"
-            metadata_text += "\n"
+                parts.append(f"  {metadata_key_label(key)}: {value_str}\n")
+            parts.append("\n")
         
         # Dataset attributes (spectral metadata)
-        metadata_text += "Spectral Attributes:\n"
+        parts.append("Spectral Attributes:\n")
         for key, value in self.current_selection.items():
-            if key not in ['_id', 'ecosis'] and value:
+            if key not in ('_id', 'ecosis') and not key.startswith('_') and value:
                 if isinstance(value, list):
                     if len(value) <= 5:
-                        value_str = ', '.join(str(v) for v in value)
+                        value_str = ', '.join(map(str, value))
                     else:
-                        value_str = f"{', '.join(str(v) for v in value[:5])}... ({len(value)} total)"
+                        value_str = f"{', '.join(map(str, value[:5]))}... ({len(value)} total)"
                 else:
                     value_str = str(value)
-                metadata_text += f"  {key.title().replace('_', ' ')}: {value_str}\n"
+                parts.append(f"  {metadata_key_label(key)}: {value_str}\n")
                 
-        self.metadata_text.SetValue(metadata_text)
+        self.metadata_text.SetValue(''.join(parts))
         
     def on_search_text(self, event):
         """Handle search text changes with timer and destruction check"""
@@ -2501,97 +3284,185 @@ class EcosysAPICurator(wx.Frame):
         if hasattr(self, 'search_timer') and self.search_timer and self.search_timer.IsRunning():
             self.search_timer.Stop()
         
-        # Start timer for 300ms delay
+        # Start timer for 200ms delay
         if hasattr(self, 'search_timer') and self.search_timer:
-            self.search_timer.Start(300, wx.TIMER_ONE_SHOT)
+            self.search_timer.Start(200, wx.TIMER_ONE_SHOT)
     
     def on_search_timer(self, event):
         """Called when search timer expires with destruction check"""
         if self._destroyed:
             return
         try:
-            self.apply_local_filters()
+            if self.needs_server_query():
+                self.load_api_data_threaded()
+            else:
+                self.apply_local_filters()
         except Exception as e:
-            print(f"DEBUG: Search timer error: {e}")
+            logger.debug("Search timer error: %s", e)
 
     def on_filter_change(self, event):
         """Handle filter changes"""
-        # Use local filtering for instant results
-        self.apply_local_filters()
+        if self.needs_server_query():
+            # Push the filters down to the API instead of filtering a narrower catalog
+            self.load_api_data_threaded()
+        else:
+            # Use local filtering for instant results
+            self.apply_local_filters()
         
-    def apply_local_filters(self):
-        """Apply current search and filter settings locally for instant results"""
-        search_term = self.search_text.GetValue().lower()
-        theme_filter = self.type_choice.GetStringSelection()
-        org_filter = self.org_choice.GetValue().strip().lower()
+    def needs_server_query(self):
+        """Check whether the current search/filters can't be answered from the loaded catalog"""
+        if self.loaded_query is None:
+            return False
         
-        self.filtered_data = []
+        filters = self.build_filters()
+        current_query = (self.search_text.GetValue(), self.serialize_filters(filters))
+        if current_query == self.loaded_query:
+            return False
         
-        for dataset in self.api_data:
-            # Apply search filter - search in title, keywords, and other text fields
-            if search_term:
-                ecosis_info = dataset.get('ecosis', {})
-                title = ecosis_info.get('package_title', '').lower()
-                keywords = dataset.get('Keywords', [])
-                if isinstance(keywords, list):
-                    keywords_str = ' '.join(str(kw) for kw in keywords).lower()
-                else:
-                    keywords_str = str(keywords).lower()
-                
-                # Search in title, keywords, and organization
-                organization = ecosis_info.get('organization', [])
-                if isinstance(organization, list):
-                    org_str = ' '.join(str(org) for org in organization).lower()
-                else:
-                    org_str = str(organization).lower()
-                
-                # Check if search term is found in any of these fields
-                if (search_term not in title and 
-                    search_term not in keywords_str and 
-                    search_term not in org_str):
-                    continue
+        # An unfiltered catalog can serve any text/theme/organization filter locally,
+        # but date ranges are only evaluated by the API
+        has_date_filter = any('date' in f for f in filters)
+        return self.loaded_query != ('', '[]') or has_date_filter
+        
+    def build_search_index(self):
+        """Precompute lowercase search fields and theme posting lists for api_data"""
+        search_lc = []
+        org_names_lc = []
+        known_orgs = set()
+        theme_postings = {}
+        
+        for row, dataset in enumerate(self.api_data):
+            ecosis_info = dataset.get('ecosis', {})
+            title_lc = (ecosis_info.get('package_title', '') or '').lower()
             
-            # Apply theme filter - simplified exact matching
-            if theme_filter and theme_filter != "All":
-                theme_list = dataset.get('Theme', [])
-                category_list = dataset.get('Category', [])
-                theme_match = False
-                
-                # Check if the selected theme appears in the Theme list
-                if isinstance(theme_list, list):
-                    theme_match = theme_filter in theme_list
-                elif isinstance(theme_list, str):
-                    theme_match = theme_filter == theme_list
-                
-                # Also check Category list if Theme didn't match
-                if not theme_match and isinstance(category_list, list):
-                    theme_match = theme_filter in category_list
-                elif not theme_match and isinstance(category_list, str):
-                    theme_match = theme_filter == category_list
-                
-                if not theme_match:
-                    continue
+            keywords = dataset.get('Keywords', [])
+            if isinstance(keywords, list):
+                keywords_lc = ' '.join(str(kw) for kw in keywords).lower()
+            else:
+                keywords_lc = str(keywords).lower()
             
-            # Apply organization filter
-            if org_filter and org_filter != "all":
-                ecosis_info = dataset.get('ecosis', {})
-                organization = ecosis_info.get('organization', [])
-                if isinstance(organization, list):
-                    org_match = any(org_filter in str(org).lower() for org in organization)
-                elif isinstance(organization, str):
-                    org_match = org_filter in organization.lower()
-                else:
-                    org_match = False
-                    
-                if not org_match:
+            organization = ecosis_info.get('organization', [])
+            if isinstance(organization, list):
+                names = [str(org).lower() for org in organization]
+                org_text_lc = ' '.join(names)
+            else:
+                names = [organization.lower()] if isinstance(organization, str) else []
+                org_text_lc = str(organization).lower()
+            
+            # Title, keywords and organizations in one column so a search term needs a single scan;
+            # the unit separator keeps a term from matching across two fields
+            search_lc.append('\x1f'.join((title_lc, keywords_lc, org_text_lc)))
+            # Unit separator keeps a typed organization from matching across two names
+            org_names_lc.append('\x1f'.join(names))
+            known_orgs.update(sys.intern(name.strip()) for name in names)
+            
+            # Theme and Category values both satisfy the theme filter
+            for field in ('Theme', 'Category'):
+                values = dataset.get(field, [])
+                if isinstance(values, str):
+                    values = [values]
+                elif not isinstance(values, list):
                     continue
-            
-            self.filtered_data.append(dataset)
+                for value in values:
+                    if not isinstance(value, str):
+                        continue
+                    postings = theme_postings.setdefault(value, [])
+                    if not postings or postings[-1] != row:
+                        postings.append(row)
+        
+        # Column arrays so filters run as vectorized substring masks
+        self.search_index = {
+            'search_lc': np.array(search_lc, dtype=str),
+            'org_names_lc': np.array(org_names_lc, dtype=str),
+            'theme_postings': {theme: np.array(rows, dtype=np.intp)
+                               for theme, rows in theme_postings.items()},
+            # Organizations offered by the dropdown, with their row masks memoized on first use
+            'known_orgs': frozenset(known_orgs),
+            'org_masks': {},
+            # (search, theme, organization) -> matching rows, least recently used first
+            'filter_results': OrderedDict(),
+        }
+    
+    def reapply_local_filters(self):
+        """Narrow a freshly loaded catalog by whatever the filter controls ask beyond the server's own query"""
+        search_term = self.search_text.GetValue()
+        theme_filter = self.type_choice.GetStringSelection()
+        org_text = self.org_choice.GetValue().strip()
+        
+        # The server already applied its query, and its text search covers fields the local index lacks
+        loaded_text, loaded_filters = self.loaded_query or ('', '[]')
+        server_filters = json.loads(loaded_filters)
+        if search_term == loaded_text:
+            search_term = ''
+        if {"Theme": theme_filter} in server_filters:
+            theme_filter = "All"
+        if org_text and {"Organization": {"$regex": re.escape(org_text), "$options": "i"}} in server_filters:
+            org_text = ''
+        
+        if (search_term.strip()
+                or (theme_filter and theme_filter != "All")
+                or (org_text and org_text.lower() != "all")):
+            self.apply_local_filters(search_term, theme_filter, org_text)
+            
+    def apply_local_filters(self, search_term=None, theme_filter=None, org_text=None):
+        """Apply the search and filter settings locally for instant results, defaulting to the current controls"""
+        if search_term is None:
+            search_term = self.search_text.GetValue()
+        search_term = search_term.lower()
+        if theme_filter is None:
+            theme_filter = self.type_choice.GetStringSelection()
+        if org_text is None:
+            org_text = self.org_choice.GetValue().strip()
+        
+        index = self.search_index
+        if index is None or len(index['search_lc']) != len(self.api_data):
+            self.build_search_index()
+            index = self.search_index
+        
+        # Retyped or backspaced queries are answered from the result cache
+        filter_key = (search_term, theme_filter, org_text)
+        matches = index['filter_results'].get(filter_key)
+        if matches is not None:
+            index['filter_results'].move_to_end(filter_key)
+        else:
+            matches = self.filter_search_index(index, search_term, theme_filter, org_text)
+            index['filter_results'][filter_key] = matches
+            if len(index['filter_results']) > FILTER_CACHE_SIZE:
+                index['filter_results'].popitem(last=False)
+        
+        self.filtered_data = DatasetView(self.api_data, matches)
         
         # Update the grid with filtered results
         wx.CallAfter(self.update_data_grid)
         wx.CallAfter(self.SetStatusText, f"Showing {len(self.filtered_data)} of {len(self.api_data)} datasets")
         
+    def filter_search_index(self, index, search_term, theme_filter, org_text):
+        """Return the api_data rows matching the search term, theme and organization filters"""
+        org_filter = org_text.lower()
+        
+        # Start from the theme posting list so other checks only see candidate rows
+        matches = np.arange(len(self.api_data), dtype=np.intp)
+        if theme_filter and theme_filter != "All":
+            matches = index['theme_postings'].get(theme_filter, matches[:0])
+        
+        # Apply search filter - search in title, keywords, and organization
+        if search_term and len(matches):
+            matches = matches[np.char.find(index['search_lc'][matches], search_term) >= 0]
+        
+        # Apply organization filter - organization text is always matched literally, like the API filter
+        if org_filter and org_filter != "all" and len(matches):
+            if org_filter in index['known_orgs']:
+                # A dropdown pick: one full-catalog scan, then a mask lookup on every later filter change
+                org_mask = index['org_masks'].get(org_filter)
+                if org_mask is None:
+                    org_mask = np.char.find(index['org_names_lc'], org_filter) >= 0
+                    index['org_masks'][org_filter] = org_mask
+                matches = matches[org_mask[matches]]
+            else:
+                matches = matches[np.char.find(index['org_names_lc'][matches], org_filter) >= 0]
+        
+        return matches
+        
     def on_load_spectral(self, event):
         """Load and display spectral data for selected dataset"""
         if not self.current_selection:
@@ -2618,44 +3489,64 @@ class EcosysAPICurator(wx.Frame):
         self.load_spectral_data_api()
         
     def load_spectral_data_api(self):
-        """Load spectral data from EcoSIS API"""
+        """Load spectral data from EcoSIS API on the worker pool"""
+        base_url = self.url_text.GetValue().rstrip('/')
+        dataset_id = self.current_selection.get('_id')
+        
+        if not dataset_id:
+            wx.MessageBox("Dataset ID not found", "Error", wx.OK | wx.ICON_ERROR)
+            return
+        
+        # Get spectra data using EcoSIS API
+        spectra_url = f"{base_url}/api/spectra/search/{dataset_id}"
+        params = {
+            'start': 0,
+            'stop': 10,  # Limit to first 10 spectra for performance
+            'filters': '[]'
+        }
+        
+        self.load_spectral_btn.Disable()
+        self.SetStatusText("Loading spectral data from API...")
+        
+        future = self.executor.submit(self.fetch_spectral_items, spectra_url, params)
+        future.add_done_callback(
+            lambda f: self.safe_call_after(self.on_spectral_api_loaded, f, dataset_id))
+        
+    def fetch_spectral_items(self, spectra_url, params):
+        """Fetch a page of spectra (worker thread), returns (status_code, items)"""
+        response = self.session.get(spectra_url, params=params, timeout=API_TIMEOUT)
+        if response.status_code != 200:
+            return response.status_code, []
+        return response.status_code, json_loads(response.content).get('items', [])
+        
+    def on_spectral_api_loaded(self, future, dataset_id):
+        """Process and plot spectra fetched by load_spectral_data_api (GUI thread)"""
+        self.load_spectral_btn.Enable()
+        
         try:
-            base_url = self.url_text.GetValue().rstrip('/')
-            dataset_id = self.current_selection.get('_id')
+            status_code, items = future.result()
             
-            if not dataset_id:
-                wx.MessageBox("Dataset ID not found", "Error", wx.OK | wx.ICON_ERROR)
+            if status_code != 200:
+                wx.MessageBox(f"API Error: HTTP {status_code}", "Error", wx.OK | wx.ICON_ERROR)
                 return
             
-            # Get spectra data using EcoSIS API
-            spectra_url = f"{base_url}/api/spectra/search/{dataset_id}"
-            params = {
-                'start': 0,
-                'stop': 10,  # Limit to first 10 spectra for performance
-                'filters': '[]'
-            }
+            if not items:
+                wx.MessageBox("No spectral data found for this dataset", "No Data", wx.OK | wx.ICON_WARNING)
+                return
             
-            response = requests.get(spectra_url, params=params, timeout=30)
+            # Ignore results for a dataset that is no longer selected
+            if not self.current_selection or self.current_selection.get('_id') != dataset_id:
+                return
+            
+            # Process and cache spectral data
+            self.cached_spectral_data = self.process_spectral_data(items)
+            self.cached_spectral_dataset_id = dataset_id
+            
+            # Plot the cached data
+            self.plot_cached_spectral_data()
+            
+            self.SetStatusText(f"Loaded {len(self.cached_spectral_data)} spectra from API")
             
-            if response.status_code == 200:
-                spectra_data = response.json()
-                items = spectra_data.get('items', [])
-                
-                if not items:
-                    wx.MessageBox("No spectral data found for this dataset", "No Data", wx.OK | wx.ICON_WARNING)
-                    return
-                
-                # Process and cache spectral data
-                self.cached_spectral_data = self.process_spectral_data(items)
-                
-                # Plot the cached data
-                self.plot_cached_spectral_data()
-                
-                self.SetStatusText(f"Loaded {len(self.cached_spectral_data)} spectra from API")
-                
-            else:
-                wx.MessageBox(f"API Error: HTTP {response.status_code}", "Error", wx.OK | wx.ICON_ERROR)
-                
         except requests.RequestException as e:
             wx.MessageBox(f"Network error: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
         except Exception as e:
@@ -2668,39 +3559,40 @@ class EcosysAPICurator(wx.Frame):
         for i, spectrum in enumerate(items[:5]):  # Limit to 5 spectra for clarity
             datapoints = spectrum.get('datapoints', {})
             
-            # Separate wavelengths from other metadata
-            spectrum_wavelengths = []
-            spectrum_reflectance = []
+            # Separate wavelengths from other metadata, sorted by wavelength
+            wavelengths, reflectance = extract_spectrum(datapoints)
             
-            for key, value in datapoints.items():
-                try:
-                    # Check if key looks like a wavelength (numeric)
-                    wavelength = float(key)
-                    if 300 <= wavelength <= 2500:  # Typical spectral range
-                        spectrum_wavelengths.append(wavelength)
-                        spectrum_reflectance.append(float(str(value)))  # Convert to float safely
-                except (ValueError, TypeError):
-                    continue  # Skip non-numeric keys (metadata)
-            
-            if spectrum_wavelengths and spectrum_reflectance:
-                # Sort by wavelength
-                sorted_data = sorted(zip(spectrum_wavelengths, spectrum_reflectance))
-                if sorted_data:
-                    wavelengths, reflectance = zip(*sorted_data)
-                    
-                    # Create meaningful legend label
-                    label = self.create_spectrum_label(spectrum, i + 1)
-                    
-                    # Store processed data
-                    processed_spectra.append({
-                        'wavelengths': wavelengths,
-                        'reflectance': reflectance,
-                        'label': label,
-                        'color_index': len(processed_spectra)
-                    })
+            if len(wavelengths):
+                # Create meaningful legend label
+                label = self.create_spectrum_label(spectrum, i + 1)
+                
+                # Store processed data
+                processed_spectra.append({
+                    'wavelengths': wavelengths,
+                    'reflectance': reflectance,
+                    'label': label,
+                    'color_index': len(processed_spectra)
+                })
         
         return processed_spectra
     
+    def get_plot_curves(self, max_points):
+        """Return (wavelengths, reflectance) per cached spectrum, downsampled once per canvas size"""
+        source = self.cached_spectral_data
+        cached = self.plot_downsample_cache
+        if cached is not None and cached[0] is source and cached[1] == max_points:
+            return cached[2]
+        
+        curves = []
+        for spectrum_data in source:
+            wavelengths = np.asarray(spectrum_data['wavelengths'])
+            reflectance = np.asarray(spectrum_data['reflectance'])
+            if max_points and len(wavelengths) > max_points * PLOT_DOWNSAMPLE_FACTOR:
+                wavelengths, reflectance = lttb(wavelengths, reflectance, max_points)
+            curves.append((wavelengths, reflectance))
+        self.plot_downsample_cache = (source, max_points, curves)
+        return curves
+    
     def plot_cached_spectral_data(self):
         """Plot spectral data from cache - efficient for redraws"""
         if not self.cached_spectral_data:
@@ -2713,20 +3605,33 @@ class EcosysAPICurator(wx.Frame):
         # Color palette for multiple spectra
         colors = plt.cm.tab10(np.linspace(0, 1, len(self.cached_spectral_data)))
         
-        # Track min/max values for dynamic axis scaling
-        all_reflectance_values = []
+        # Spectra far denser than the canvas can show are reduced to a few vertices per pixel
+        canvas_width = self.spectral_canvas.GetSize().width
+        max_points = canvas_width * PLOT_POINTS_PER_PIXEL if canvas_width > 10 else 0
+        curves = self.get_plot_curves(max_points)
         
-        # Plot each cached spectrum
-        for spectrum_data in self.cached_spectral_data:
-            self.spectral_axes.plot(spectrum_data['wavelengths'], 
-                                  spectrum_data['reflectance'],
-                                  color=colors[spectrum_data['color_index']], 
-                                  label=spectrum_data['label'], 
-                                  alpha=0.8, 
-                                  linewidth=1.5)
-            
-            # Collect all reflectance values for axis scaling
-            all_reflectance_values.extend(spectrum_data['reflectance'])
+        # Build one (n, 2) segment per spectrum and draw them as a single collection
+        segments = []
+        segment_colors = []
+        legend_handles = []
+        all_reflectance_values = []
+        for spectrum_data, (wavelengths, reflectance) in zip(self.cached_spectral_data, curves):
+            all_reflectance_values.append(np.asarray(spectrum_data['reflectance']))
+            segment = np.column_stack((wavelengths, reflectance))
+            color = colors[spectrum_data['color_index']]
+            segments.append(segment)
+            segment_colors.append(color)
+            legend_handles.append(Line2D([], [], color=color, alpha=0.8, linewidth=1.5,
+                                         label=spectrum_data['label']))
+        
+        # Animated so the cached background excludes it and blit_spectral_plot can redraw it alone
+        self.spectral_collection = LineCollection(segments, colors=segment_colors,
+                                                  alpha=0.8, linewidths=1.5, animated=True)
+        self.spectral_axes.add_collection(self.spectral_collection)
+        self.spectral_collection_source = self.cached_spectral_data
+        
+        # Full-resolution reflectance values for dynamic axis scaling
+        all_reflectance_values = np.concatenate(all_reflectance_values) if all_reflectance_values else []
         
         # Update plot with dataset title
         dataset_title = self.current_selection.get('ecosis', {}).get('package_title', 'Unknown')
@@ -2736,9 +3641,9 @@ class EcosysAPICurator(wx.Frame):
         self.spectral_axes.set_xlim(300, 2500)
         
         # Dynamic Y-axis scaling based on actual data
-        if all_reflectance_values:
-            y_min = min(all_reflectance_values)
-            y_max = max(all_reflectance_values)
+        if len(all_reflectance_values):
+            y_min = float(np.min(all_reflectance_values))
+            y_max = float(np.max(all_reflectance_values))
             y_range = y_max - y_min
             
             # Add 5% padding above and below
@@ -2753,260 +3658,361 @@ class EcosysAPICurator(wx.Frame):
             self.spectral_axes.set_ylabel("Reflectance")
         
         # Configure legend
-        if self.cached_spectral_data:
-            legend = self.spectral_axes.legend(loc='upper right', 
+        if legend_handles:
+            legend = self.spectral_axes.legend(handles=legend_handles,
+                                             loc='upper right', 
                                              framealpha=0.9, 
                                              fancybox=True, 
                                              shadow=True)
-            # Adjust legend text color for dark mode
-            if wx.SystemSettings.GetAppearance().IsDark():
-                for text in legend.get_texts():
-                    text.set_color('white')
+            # Match legend text to the current theme
+            for text in legend.get_texts():
+                text.set_color('white' if self._is_dark else 'black')
         
-        # Apply tight layout and draw
-        self.spectral_figure.tight_layout()
+        # Draw (constrained layout is resolved as part of the draw)
         self.spectral_canvas.draw()
     
     def create_spectrum_label(self, spectrum, spectrum_num):
         """Create a meaningful label for spectrum legend"""
-        # Priority order for creating informative labels
-        label_parts = []
-        
-        # 1. Try scientific name
-        scientific_name = spectrum.get('Scientific Name')
-        if scientific_name:
-            if isinstance(scientific_name, list) and scientific_name:
-                label_parts.append(str(scientific_name[0]))
-            elif isinstance(scientific_name, str):
-                label_parts.append(scientific_name)
-        
-        # 2. Try common name if no scientific name
-        if not label_parts:
-            common_name = spectrum.get('Common Name')
-            if common_name:
-                if isinstance(common_name, list) and common_name:
-                    label_parts.append(str(common_name[0]))
-                elif isinstance(common_name, str):
-                    label_parts.append(common_name)
-        
-        # 3. Try sample ID or specimen ID
-        if not label_parts:
-            for field in ['Sample ID', 'Specimen ID', 'ID', 'Sample_ID', 'Unique_ID']:
-                sample_id = spectrum.get(field)
-                if sample_id:
-                    if isinstance(sample_id, list) and sample_id:
-                        label_parts.append(f"ID: {sample_id[0]}")
-                    elif isinstance(sample_id, str):
-                        label_parts.append(f"ID: {sample_id}")
-                    break
+        # First usable field in priority order: scientific name, common name, then sample IDs
+        for field, template in SPECTRUM_LABEL_FIELDS:
+            value = spectrum.get(field)
+            if not value:
+                continue
+            if isinstance(value, list):
+                return f"S{spectrum_num}: {template.format(value[0])}"
+            if isinstance(value, str):
+                return f"S{spectrum_num}: {template.format(value)}"
         
         # Fallback to generic spectrum number
-        if not label_parts:
-            return f"Spectrum {spectrum_num}"
-        
-        # Combine parts (limit to 2 parts for readability)
-        label = " - ".join(label_parts[:2])
-        
-        # Add spectrum number if we have other info
-        if label_parts:
-            return f"S{spectrum_num}: {label}"
-        else:
-            return f"Spectrum {spectrum_num}"
+        return f"Spectrum {spectrum_num}"
             
     def on_calculate_indices(self, event):
         """Calculate vegetation indices for current spectral data"""
         if not self.current_selection:
             wx.MessageBox("Please load spectral data first", "No Data", wx.OK | wx.ICON_WARNING)
             return
-            
+        
+        base_url = self.url_text.GetValue().rstrip('/')
+        dataset_id = self.current_selection.get('_id')
+        
+        # Stats are reused per dataset until the next refresh
+        stats_key = (base_url, dataset_id)
+        stats_data = self.get_cached_stats(stats_key)
+        
+        # The worker gets the spectra loaded for this dataset as they are now; the GUI may replace them meanwhile
+        spectra = self.cached_spectral_data if self.cached_spectral_dataset_id == dataset_id else None
+        
+        self.calc_indices_btn.Disable()
+        self.SetStatusText("Calculating vegetation indices...")
+        
+        future = self.executor.submit(self.calculate_vegetation_indices, base_url, dataset_id, stats_data, spectra)
+        future.add_done_callback(
+            lambda f: self.safe_call_after(self.on_vegetation_indices_calculated, f, stats_key))
+        
+    def calculate_vegetation_indices(self, base_url, dataset_id, stats_data, spectra):
+        """Fetch statistics if needed and compute every index (worker thread), returns (status_code, stats, stats indices, spectra indices)"""
+        if stats_data is None:
+            status_code, stats_data = self.fetch_spectral_stats(f"{base_url}/api/spectra/stats/{dataset_id}")
+            if status_code != 200:
+                return status_code, None, None, None
+        
+        return 200, stats_data, self.calculate_stats_indices(stats_data), self.calculate_loaded_spectra_indices(spectra)
+        
+    def fetch_spectral_stats(self, stats_url):
+        """Fetch a dataset's per-wavelength statistics (worker thread), returns (status_code, stats)"""
+        response = self.session.get(stats_url, timeout=API_TIMEOUT)
+        if response.status_code != 200:
+            return response.status_code, None
+        return response.status_code, json_loads(response.content)
+        
+    def on_vegetation_indices_calculated(self, future, stats_key):
+        """Cache fetched statistics and show the indices if the dataset is still selected (GUI thread)"""
+        self.calc_indices_btn.Enable()
+        self.SetStatusText("Ready")
+        
         try:
-            # Get spectral statistics to calculate indices
-            base_url = self.url_text.GetValue().rstrip('/')
-            dataset_id = self.current_selection.get('_id')
-            
-            stats_url = f"{base_url}/api/spectra/stats/{dataset_id}"
-            response = requests.get(stats_url, timeout=30)
-            
-            if response.status_code == 200:
-                stats_data = response.json()
-                
-                # Calculate common vegetation indices
-                indices_results = {}
-                
-                # Try to calculate NDVI (NIR - Red) / (NIR + Red)
-                # Look for wavelengths around 670nm (Red) and 800nm (NIR)
-                red_bands = [key for key in stats_data.keys() if self.is_near_wavelength(key, 670, 20)]
-                nir_bands = [key for key in stats_data.keys() if self.is_near_wavelength(key, 800, 50)]
-                
-                if red_bands and nir_bands:
-                    red_key = min(red_bands, key=lambda x: abs(float(x) - 670))
-                    nir_key = min(nir_bands, key=lambda x: abs(float(x) - 800))
-                    
-                    red_avg = float(stats_data[red_key]['avg'])
-                    nir_avg = float(stats_data[nir_key]['avg'])
-                    
-                    ndvi = (nir_avg - red_avg) / (nir_avg + red_avg) if (nir_avg + red_avg) != 0 else 0
-                    indices_results['NDVI'] = f"{ndvi:.4f} (Red: {red_key}nm, NIR: {nir_key}nm)"
-                
-                # Calculate other indices if possible
-                green_bands = [key for key in stats_data.keys() if self.is_near_wavelength(key, 550, 30)]
-                if green_bands and red_bands and nir_bands:
-                    green_key = min(green_bands, key=lambda x: abs(float(x) - 550))
-                    green_avg = float(stats_data[green_key]['avg'])
-                    
-                    # Simple Ratio (SR)
-                    sr = nir_avg / red_avg if red_avg != 0 else 0
-                    indices_results['Simple Ratio (SR)'] = f"{sr:.4f}"
-                    
-                    # Green NDVI
-                    gndvi = (nir_avg - green_avg) / (nir_avg + green_avg) if (nir_avg + green_avg) != 0 else 0
-                    indices_results['GNDVI'] = f"{gndvi:.4f} (Green: {green_key}nm)"
-                
-                # Display results
-                if indices_results:
-                    results_text = "Calculated Vegetation Indices:\n\n"
-                    for index_name, value in indices_results.items():
-                        results_text += f"{index_name}: {value}\n"
-                    
-                    results_text += f"\nDataset: {self.current_selection.get('ecosis', {}).get('package_title', 'Unknown')}"
-                    results_text += f"\nTotal Spectra: {stats_data.get(list(stats_data.keys())[0], {}).get('count', 0)}"
-                    
-                    wx.MessageBox(results_text, "Vegetation Indices", wx.OK | wx.ICON_INFORMATION)
-                else:
-                    wx.MessageBox("Could not calculate indices - required wavelengths not found", "Info", wx.OK | wx.ICON_INFORMATION)
-                    
-            else:
-                wx.MessageBox(f"Could not retrieve spectral statistics: HTTP {response.status_code}", "Error", wx.OK | wx.ICON_ERROR)
-                
+            status_code, stats_data, indices_results, spectra_results = future.result()
         except Exception as e:
             wx.MessageBox(f"Error calculating indices: {str(e)}", "Error", wx.OK | wx.ICON_ERROR)
-    
-    def is_near_wavelength(self, key_str, target_wavelength, tolerance):
-        """Check if a wavelength key is near the target wavelength within tolerance"""
-        try:
-            wavelength = float(key_str)
-            return abs(wavelength - target_wavelength) <= tolerance
-        except ValueError:
-            return False
+            return
+        
+        if status_code != 200:
+            wx.MessageBox(f"Could not retrieve spectral statistics: HTTP {status_code}", "Error", wx.OK | wx.ICON_ERROR)
+            return
         
+        self.cache_stats(stats_key, stats_data)
+        
+        # Ignore results for a dataset that is no longer selected
+        if not self.current_selection or self.current_selection.get('_id') != stats_key[1]:
+            return
+        self.show_vegetation_indices(stats_data, indices_results, spectra_results)
+        
+    def calculate_stats_indices(self, stats_data):
+        """Format every vegetation index computable from the band averages of a stats payload"""
+        indices_results = {}
+        
+        # Wavelength keys are parsed once; each band is then an argmin over that array
+        band_keys, band_wavelengths = wavelength_keys(stats_data)
+        
+        # Average reflectance of every band found within tolerance of its centre wavelength
+        band_key = {}
+        band_avg = {}
+        for band, (label, centre, tolerance) in INDEX_BANDS.items():
+            key = nearest_band(band_keys, band_wavelengths, centre, tolerance)
+            if key is not None:
+                band_key[band] = key
+                band_avg[band] = float(stats_data[key]['avg'])
+        
+        # Each index is computed once all of its bands were found
+        index_values = compute_indices(band_avg)
+        for index_name, bands, formula in VEGETATION_INDICES:
+            if index_name in index_values:
+                used = ", ".join(f"{INDEX_BANDS[band][0]}: {band_key[band]}nm" for band in bands)
+                indices_results[index_name] = f"{float(index_values[index_name]):.4f} ({used})"
+        
+        return indices_results
+        
+    def show_vegetation_indices(self, stats_data, indices_results, spectra_results):
+        """Display the calculated vegetation indices of the selected dataset"""
+        if not indices_results:
+            wx.MessageBox("Could not calculate indices - required wavelengths not found", "Info", wx.OK | wx.ICON_INFORMATION)
+            return
+        
+        results_text = "Calculated Vegetation Indices:\n\n"
+        for index_name, value in indices_results.items():
+            results_text += f"{index_name}: {value}\n"
+        
+        if spectra_results:
+            results_text += f"\nLoaded Spectra ({spectra_results['count']}), mean ± std:\n"
+            for index_name, (mean, std) in spectra_results['indices'].items():
+                results_text += f"{index_name}: {mean:.4f} ± {std:.4f}\n"
+        
+        results_text += f"\nDataset: {self.current_selection.get('ecosis', {}).get('package_title', 'Unknown')}"
+        results_text += f"\nTotal Spectra: {stats_data.get(list(stats_data.keys())[0], {}).get('count', 0)}"
+        
+        wx.MessageBox(results_text, "Vegetation Indices", wx.OK | wx.ICON_INFORMATION)
+    
+    def get_cached_stats(self, stats_key):
+        """Return a cached stats payload, or None when it has not been fetched since the last refresh"""
+        stats_data = self.stats_cache.get(stats_key)
+        if stats_data is not None:
+            self.stats_cache.move_to_end(stats_key)
+        return stats_data
+        
+    def cache_stats(self, stats_key, stats_data):
+        """Remember a stats payload, evicting the least recently used beyond STATS_CACHE_SIZE"""
+        self.stats_cache[stats_key] = stats_data
+        self.stats_cache.move_to_end(stats_key)
+        while len(self.stats_cache) > STATS_CACHE_SIZE:
+            self.stats_cache.popitem(last=False)
+        
+    def calculate_loaded_spectra_indices(self, spectra):
+        """Compute the vegetation indices for every loaded spectrum of a dataset as array expressions"""
+        if not spectra:
+            return None
+        
+        # Only the index band centres are interpolated; bands outside a spectrum are NaN
+        matrix = sample_spectra(spectra, INDEX_BAND_CENTRES)
+        indices = compute_indices(dict(zip(INDEX_BANDS, matrix.T)))
+        
+        summary = {}
+        for index_name, values in indices.items():
+            values = values[np.isfinite(values)]
+            if values.size:
+                summary[index_name] = (float(values.mean()), float(values.std()))
+        
+        if not summary:
+            return None
+        return {'count': len(matrix), 'indices': summary}
+    
     def on_add_download(self, event):
         """Add selected dataset to download queue"""
         if not self.current_selection:
             wx.MessageBox("Please select a dataset first", "No Selection", wx.OK | wx.ICON_WARNING)
             return
             
-        # Add to download list
+        self.queue_download(self.current_selection)
+        
+    def queue_download(self, dataset):
+        """Append a dataset to the download queue, remembering its catalog entry for the worker"""
         index = self.download_list.GetItemCount()
-        dataset_title = self.current_selection.get('ecosis', {}).get('package_title', 'Unknown')
+        dataset_title = dataset.get('ecosis', {}).get('package_title', 'Unknown')
         self.download_list.InsertItem(index, dataset_title)
         self.download_list.SetItem(index, 1, "Queued")
         self.download_list.SetItem(index, 2, "0%")
         self.download_list.SetItem(index, 3, "Unknown")
+        self.download_queue_datasets.append(dataset)
         
     def on_start_downloads(self, event):
         """Start downloading queued datasets"""
-        if self.download_list.GetItemCount() == 0:
+        total_items = self.download_list.GetItemCount()
+        if total_items == 0:
             wx.MessageBox("No datasets in download queue", "Empty Queue", wx.OK | wx.ICON_WARNING)
             return
-            
-        # Start download thread
-        download_thread = threading.Thread(target=self.download_datasets)
+        
+        # Read the queue on the GUI thread; workers only receive plain values
+        queued_items = [(i, self.download_list.GetItemText(i), self.download_queue_datasets[i])
+                        for i in range(total_items)]
+        base_url = self.url_text.GetValue().rstrip('/')
+        download_path = self.download_path.GetValue()
+        
+        # Start coordinator thread
+        download_thread = threading.Thread(target=self.download_datasets,
+                                           args=(queued_items, base_url, download_path))
         download_thread.daemon = True
         download_thread.start()
         
-    def download_datasets(self):
-        """Download all datasets in queue using EcoSIS export API"""
-        download_path = self.download_path.GetValue()
+    def download_datasets(self, queued_items, base_url, download_path):
+        """Download all datasets in queue concurrently using EcoSIS export API"""
         os.makedirs(download_path, exist_ok=True)
         
-        base_url = self.url_text.GetValue().rstrip('/')
-        total_items = self.download_list.GetItemCount()
+        total_items = len(queued_items)
+        with self.download_progress_lock:
+            self.downloads_completed = 0
+            self.download_progress_value = 0
         
-        for i in range(total_items):
-            dataset_name = self.download_list.GetItemText(i)
-            wx.CallAfter(self.download_list.SetItem, i, 1, "Downloading")
-            
+        # Each queue row carries its catalog entry, so duplicate titles resolve to the right dataset
+        futures = [self.download_executor.submit(self.download_export_worker, i, dataset_name,
+                                                 dataset_meta, base_url, download_path, total_items)
+                   for i, dataset_name, dataset_meta in queued_items]
+        
+        # Wait for every queued dataset before reporting completion
+        for future in as_completed(futures):
             try:
-                # Find the dataset by name in our current data
-                dataset_id = None
-                for dataset in self.api_data:
-                    if dataset.get('ecosis', {}).get('package_title', '') == dataset_name:
-                        dataset_id = dataset.get('_id')
-                        break
-                
-                if not dataset_id:
-                    wx.CallAfter(self.download_list.SetItem, i, 1, "Error: ID not found")
-                    continue
-                
-                # Use EcoSIS export API
-                export_url = f"{base_url}/api/package/{dataset_id}/export"
-                params = {
-                    'metadata': 'true',  # Include metadata
-                    'filters': '[]'  # No additional filters
-                }
-                
-                wx.CallAfter(self.download_list.SetItem, i, 2, "10%")
-                
-                response = requests.get(export_url, params=params, timeout=120)
-                
-                wx.CallAfter(self.download_list.SetItem, i, 2, "50%")
+                future.result()
+            except Exception as e:
+                logger.debug("Download worker error: %s", e)
+        
+        if self._destroyed:
+            return
+        wx.CallAfter(self.download_progress_bar.SetValue, 100)
+        wx.CallAfter(self.SetStatusText, "Downloads complete")
+        
+    def download_export_worker(self, i, dataset_name, dataset_meta, base_url, download_path, total_items):
+        """Download one queued dataset export, streaming the response to disk"""
+        if self._destroyed:
+            return
+        wx.CallAfter(self.set_download_row, i, "Downloading")
+        
+        try:
+            dataset_id = dataset_meta.get('_id') if dataset_meta else None
+            
+            if not dataset_id:
+                wx.CallAfter(self.set_download_row, i, "Error: ID not found")
+                return
+            
+            # Use EcoSIS export API
+            export_url = f"{base_url}/api/package/{dataset_id}/export"
+            params = {
+                'metadata': 'true',  # Include metadata
+                'filters': '[]'  # No additional filters
+            }
+            
+            with self.session.get(export_url, params=params, timeout=(API_TIMEOUT[0], 120), stream=True) as response:
                 
                 if response.status_code == 200:
+                    total = int(response.headers.get('Content-Length', 0) or 0)
+                    stem = dataset_name.translate(FILENAME_TRANSLATION)
+                    
                     # Save CSV file
-                    filename = f"{dataset_name.replace(' ', '_').replace('/', '_')}.csv"
+                    filename = f"{stem}.csv"
                     filepath = os.path.join(download_path, filename)
                     
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
+                    written = 0
+                    reported = 0
+                    last_pct = -1
+                    with open(filepath, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=64 * 1024):
+                            # Block here while the queue is paused
+                            self.download_resume_event.wait()
+                            if self._destroyed:
+                                return
+                            if not chunk:
+                                continue
+                            f.write(chunk)
+                            written += len(chunk)
+                            # Report real byte progress at most once per MiB, and only when it moves
+                            if total and written - reported >= DOWNLOAD_PROGRESS_STEP:
+                                reported = written
+                                pct = min(written * 100 // total, 99)
+                                if pct != last_pct:
+                                    last_pct = pct
+                                    wx.CallAfter(self.set_download_row, i, progress=f"{pct}%")
                     
-                    wx.CallAfter(self.download_list.SetItem, i, 2, "100%")
-                    wx.CallAfter(self.download_list.SetItem, i, 1, "Complete")
+                    wx.CallAfter(self.set_download_row, i, "Complete", "100%")
                     
                     # Also download dataset metadata as JSON
-                    metadata_filename = f"{dataset_name.replace(' ', '_').replace('/', '_')}_metadata.json"
+                    metadata_filename = f"{stem}_metadata.json"
                     metadata_filepath = os.path.join(download_path, metadata_filename)
                     
-                    # Find the dataset in our data
-                    dataset_metadata = None
-                    for dataset in self.api_data:
-                        if dataset.get('ecosis', {}).get('package_title', '') == dataset_name:
-                            dataset_metadata = dataset
-                            break
-                    
-                    if dataset_metadata:
-                        with open(metadata_filepath, 'w', encoding='utf-8') as f:
-                            json.dump(dataset_metadata, f, indent=2)
+                    # Drop the grid's cached row cells, cell overrides and local flag before writing
+                    metadata = {key: value for key, value in dataset_meta.items()
+                                if key not in ('_row', '_cells', '_is_local')}
+                    with open(metadata_filepath, 'wb') as f:
+                        f.write(json_dumps(metadata, indent=True))
                     
                 else:
-                    wx.CallAfter(self.download_list.SetItem, i, 1, f"HTTP Error: {response.status_code}")
-                
-            except requests.RequestException as e:
-                wx.CallAfter(self.download_list.SetItem, i, 1, f"Network Error")
-            except Exception as e:
-                wx.CallAfter(self.download_list.SetItem, i, 1, f"Error: {str(e)[:20]}")
-                
-            # Update overall progress
-            progress = ((i + 1) * 100) // total_items
-            wx.CallAfter(self.download_progress_bar.SetValue, progress)
-                
-        wx.CallAfter(self.download_progress_bar.SetValue, 100)
-        wx.CallAfter(self.SetStatusText, "Downloads complete")
+                    wx.CallAfter(self.set_download_row, i, f"HTTP Error: {response.status_code}")
+            
+        except requests.RequestException as e:
+            wx.CallAfter(self.set_download_row, i, f"Network Error")
+        except Exception as e:
+            wx.CallAfter(self.set_download_row, i, f"Error: {str(e)[:20]}")
+        finally:
+            # Update overall progress from the shared completion counter, posting only on change
+            with self.download_progress_lock:
+                self.downloads_completed += 1
+                progress = (self.downloads_completed * 100) // total_items
+                changed = progress != self.download_progress_value
+                self.download_progress_value = progress
+            if changed and not self._destroyed:
+                wx.CallAfter(self.download_progress_bar.SetValue, progress)
+        
+    def set_download_row(self, i, status=None, progress=None):
+        """Update the status and/or progress columns of a download queue row in one GUI call"""
+        if status is not None:
+            self.download_list.SetItem(i, 1, status)
+        if progress is not None:
+            self.download_list.SetItem(i, 2, progress)
         
     def on_pause_downloads(self, event):
-        """Pause current downloads"""
-        # Implementation for pausing downloads
-        pass
+        """Pause or resume the download queue"""
+        if self.download_resume_event.is_set():
+            self.download_resume_event.clear()
+            self.pause_download_btn.SetLabel("Resume")
+            self.SetStatusText("Downloads paused")
+        else:
+            self.download_resume_event.set()
+            self.pause_download_btn.SetLabel("Pause")
+            self.SetStatusText("Downloads resumed")
         
     def on_clear_queue(self, event):
         """Clear download queue"""
         self.download_list.DeleteAllItems()
+        self.download_queue_datasets.clear()
         self.download_progress_bar.SetValue(0)
         
+    def on_download_path_change(self, event):
+        """Rescan the download folder shortly after its path is edited"""
+        event.Skip()
+        if self._destroyed:
+            return
+        if hasattr(self, 'path_timer') and self.path_timer:
+            self.path_timer.Start(500, wx.TIMER_ONE_SHOT)
+            
+    def on_path_timer(self, event):
+        """Rebuild the local file index when the download folder really changed"""
+        if self._destroyed:
+            return
+        if self.download_path.GetValue() != self.local_folder:
+            self.check_local_data()
+        
     def on_browse_path(self, event):
         """Browse for download directory"""
         dlg = wx.DirDialog(self, "Choose download directory")
         if dlg.ShowModal() == wx.ID_OK:
             self.download_path.SetValue(dlg.GetPath())
+            self.check_local_data()
         dlg.Destroy()
 
     def write_merge_file_header(self, output_file, total_files):
@@ -3034,9 +4040,12 @@ class EcosysAPICurator(wx.Frame):
             # Check memory before loading file
             initial_memory = memory_monitor.get_current_memory_mb()
             if memory_monitor.should_pause_processing():
-                print(f"DEBUG: Skipping {filepath} - memory threshold reached before processing")
+                logger.debug("Skipping %s - memory threshold reached before processing", filepath)
                 return 0
             
+            if ijson is not None:
+                return self.stream_single_file_ijson(filepath, output_file, is_first_dataset, memory_monitor)
+            
             # Read JSON file with explicit memory management
             with open(filepath, 'r', encoding='utf-8') as input_file:
                 data = json.load(input_file)
@@ -3045,15 +4054,15 @@ class EcosysAPICurator(wx.Frame):
             spectra = data.get('spectra', [])
             
             if not spectra:
-                print(f"DEBUG: No spectra found in {filepath}")
+                logger.debug("No spectra found in %s", filepath)
                 return 0
             
             # Check memory after loading
             post_load_memory = memory_monitor.get_current_memory_mb()
             memory_increase = post_load_memory - initial_memory
             
-            print(f"DEBUG: Processing {len(spectra)} spectra from {os.path.basename(filepath)} "
-                  f"(memory increase: {memory_increase:.1f}MB)")
+            logger.debug("Processing %s spectra from %s (memory increase: %.1fMB)",
+                         len(spectra), os.path.basename(filepath), memory_increase)
             
             # Add comma if not the first dataset
             if not is_first_dataset:
@@ -3075,7 +4084,7 @@ class EcosysAPICurator(wx.Frame):
                 # Ultra-conservative: process in very small chunks
                 chunk_size = 25
                 max_spectra = min(spectra_count, 2000)  # Limit to 2000 spectra max
-                print(f"DEBUG: Large dataset detected, processing first {max_spectra} spectra in chunks of {chunk_size}")
+                logger.debug("Large dataset detected, processing first %s spectra in chunks of %s", max_spectra, chunk_size)
             elif spectra_count > 1000:
                 # Moderate: normal chunking
                 chunk_size = 100
@@ -3094,7 +4103,7 @@ class EcosysAPICurator(wx.Frame):
             for chunk_start in range(0, min(max_spectra, spectra_count), chunk_size):
                 # Progressive memory check - more lenient early on, stricter later
                 if spectra_written > 500 and memory_monitor.should_pause_processing():
-                    print(f"DEBUG: Memory threshold reached after processing {spectra_written} spectra")
+                    logger.debug("Memory threshold reached after processing %s spectra", spectra_written)
                     break
                 
                 chunk_end = min(chunk_start + chunk_size, min(max_spectra, spectra_count))
@@ -3121,8 +4130,8 @@ class EcosysAPICurator(wx.Frame):
                 # Progress feedback for large datasets
                 if spectra_written % 500 == 0 and spectra_written > 0:
                     current_memory = memory_monitor.get_current_memory_mb()
-                    print(f"DEBUG: Processed {spectra_written}/{min(max_spectra, spectra_count)} spectra, "
-                          f"memory: {current_memory:.1f}MB")
+                    logger.debug("Processed %s/%s spectra, memory: %.1fMB",
+                                 spectra_written, min(max_spectra, spectra_count), current_memory)
             
             output_file.write('\n      ]\n')
             output_file.write('    }')
@@ -3131,8 +4140,8 @@ class EcosysAPICurator(wx.Frame):
             final_memory = memory_monitor.get_current_memory_mb()
             total_increase = final_memory - initial_memory
             
-            print(f"DEBUG: Completed {os.path.basename(filepath)}: {spectra_written} spectra written, "
-                  f"total memory increase: {total_increase:.1f}MB")
+            logger.debug("Completed %s: %s spectra written, total memory increase: %.1fMB",
+                         os.path.basename(filepath), spectra_written, total_increase)
             
             # Clear all references and return count
             spectra = None
@@ -3143,7 +4152,7 @@ class EcosysAPICurator(wx.Frame):
             return spectra_written
             
         except MemoryError:
-            print(f"DEBUG: Memory error processing {filepath}")
+            logger.debug("Memory error processing %s", filepath)
             # Clean up and return what we managed to process
             spectra = None
             dataset_info = None
@@ -3152,7 +4161,7 @@ class EcosysAPICurator(wx.Frame):
             return 0  # Since we can't track partial progress in this error case
             
         except Exception as e:
-            print(f"DEBUG: Error processing {filepath}: {str(e)}")
+            logger.debug("Error processing %s: %s", filepath, e)
             spectra = None
             dataset_info = None
             data = None
@@ -3169,6 +4178,54 @@ class EcosysAPICurator(wx.Frame):
                 spectra = None
             gc.collect()
 
+    def stream_single_file_ijson(self, filepath, output_file, is_first_dataset, memory_monitor):
+        """Merge one spectra file with ijson, holding a single spectrum in memory at a time"""
+        with open(filepath, 'rb') as input_file:
+            dataset_info = next(ijson.items(input_file, 'dataset_info', use_float=True), {})
+        
+        # The entry is staged and only copied to the merge output once the whole file parsed,
+        # so a truncated or invalid file cannot leave a half-written entry behind
+        with open(filepath, 'rb') as input_file, \
+                tempfile.SpooledTemporaryFile(max_size=MERGE_SPOOL_SIZE, mode='w+', encoding='utf-8') as staged:
+            spectra = ijson.items(input_file, 'spectra.item', use_float=True)
+            first_spectrum = next(spectra, None)
+            if first_spectrum is None:
+                logger.debug("No spectra found in %s", filepath)
+                return 0
+            
+            staged.write('    {\n')
+            staged.write(f'      "source_file": "{os.path.basename(filepath)}",\n')
+            staged.write('      "dataset_info": ')
+            json.dump(dataset_info, staged, indent=6)
+            staged.write(',\n')
+            staged.write('      "spectra": [\n')
+            
+            spectra_written = 0
+            for spectrum in itertools.chain((first_spectrum,), spectra):
+                if spectra_written and spectra_written % 500 == 0 and memory_monitor.should_pause_processing():
+                    logger.debug("Memory threshold reached after processing %s spectra", spectra_written)
+                    break
+                
+                if spectra_written > 0:
+                    staged.write(',\n')
+                staged.write('        ')
+                json.dump(spectrum, staged, separators=(',', ':'))
+                spectra_written += 1
+            
+            # The count is only known once the stream is exhausted, so it follows the spectra
+            staged.write('\n      ],\n')
+            staged.write(f'      "spectra_count": {spectra_written}\n')
+            staged.write('    }')
+            
+            # Add comma if not the first dataset
+            if not is_first_dataset:
+                output_file.write(',\n')
+            staged.seek(0)
+            shutil.copyfileobj(staged, output_file)
+        
+        logger.debug("Completed %s: %s spectra written", os.path.basename(filepath), spectra_written)
+        return spectra_written
+
     def batch_processing_worker(self, spectra_files, output_dir, files_per_batch):
         """Background worker with better progress reporting and cleanup safety"""
         import gc
@@ -3221,7 +4278,7 @@ class EcosysAPICurator(wx.Frame):
                     self.batch_progress['total_datasets'] += batch_datasets
                     self.batch_progress['total_spectra'] += batch_spectra
                     
-                    print(f"DEBUG: Batch {batch_num + 1} complete: {batch_datasets} datasets, {batch_spectra} spectra")
+                    logger.debug("Batch %s complete: %s datasets, %s spectra", batch_num + 1, batch_datasets, batch_spectra)
                 
                 # Update status
                 self.batch_progress['current_status'] = f'Completed batch {batch_num + 1}/{total_batches}'
@@ -3241,7 +4298,7 @@ class EcosysAPICurator(wx.Frame):
         except Exception as e:
             self.batch_progress['error'] = str(e)
             self.batch_progress['current_status'] = f'Error: {str(e)}'
-            print(f"DEBUG: Batch processing thread error: {str(e)}")
+            logger.debug("Batch processing thread error: %s", e)
             
             # Re-enable controls on error
             if not self._destroyed:
@@ -3259,7 +4316,7 @@ class EcosysAPICurator(wx.Frame):
             if hasattr(self, 'progress_dialog') and self.progress_dialog:
                 wx.CallLater(3000, self.close_progress_dialog)
         except Exception as e:
-            print(f"DEBUG: Cleanup error: {e}")
+            logger.debug("Cleanup error: %s", e)
             
     def close_progress_dialog(self):
         """Close progress dialog if it exists with destruction check"""
@@ -3335,7 +4392,7 @@ class EcosysAPICurator(wx.Frame):
                     
                     # Check memory before each file (more conservative in thread)
                     if memory_monitor.should_pause_processing():
-                        print(f"DEBUG: Memory pressure in batch thread - processed {i}/{len(batch_files)} files")
+                        logger.debug("Memory pressure in batch thread - processed %s/%s files", i, len(batch_files))
                         break
                     
                     try:
@@ -3348,7 +4405,7 @@ class EcosysAPICurator(wx.Frame):
                             first_dataset = False
                             
                     except Exception as e:
-                        print(f"DEBUG: Error in batch processing {filepath}: {str(e)}")
+                        logger.debug("Error in batch processing %s: %s", filepath, e)
                         continue
                     
                     # More aggressive cleanup in background thread
@@ -3361,7 +4418,7 @@ class EcosysAPICurator(wx.Frame):
             return datasets_processed, total_spectra
             
         except Exception as e:
-            print(f"DEBUG: Error processing batch: {str(e)}")
+            logger.debug("Error processing batch: %s", e)
             return 0, 0
 
     def on_merge_local_spectra(self, event):
@@ -3439,34 +4496,53 @@ class EcosysAPICurator(wx.Frame):
         
         if dlg.ShowModal() == wx.ID_OK:
             filepath = dlg.GetPath()
+            
+            # Only raster output needs print resolution; vector formats ignore it
+            savefig_kwargs = {}
+            if os.path.splitext(filepath)[1].lower() not in ('.pdf', '.svg'):
+                savefig_kwargs['dpi'] = 300
+            
+            # The worker renders a detached copy, so GUI redraws of the live figure cannot race the export.
+            # The spectra are animated (blitted) on screen and must be drawn normally in the file.
             try:
-                # Ensure tight layout before saving
-                self.spectral_figure.tight_layout()
-                
-                # High quality export settings
-                self.spectral_figure.savefig(filepath, 
-                                           dpi=300, 
-                                           bbox_inches='tight',
-                                           facecolor=self.spectral_figure.get_facecolor(),
-                                           edgecolor='none',
-                                           transparent=False)
-                
-                wx.MessageBox(f"Plot saved successfully to:\n{filepath}", "Export Complete", wx.OK | wx.ICON_INFORMATION)
-                
+                figure = pickle.loads(pickle.dumps(self.spectral_figure))
             except Exception as e:
                 wx.MessageBox(f"Error saving plot: {str(e)}", "Export Error", wx.OK | wx.ICON_ERROR)
+                dlg.Destroy()
+                return
+            for axes in figure.axes:
+                for artist in axes.get_children():
+                    if artist.get_animated():
+                        artist.set_animated(False)
+            
+            self.export_plot_btn.Disable()
+            self.SetStatusText("Exporting plot...")
+            future = self.executor.submit(figure.savefig, filepath,
+                                          bbox_inches='tight',
+                                          facecolor=figure.get_facecolor(),
+                                          edgecolor='none',
+                                          transparent=False,
+                                          **savefig_kwargs)
+            future.add_done_callback(
+                lambda f: self.safe_call_after(self.on_plot_exported, f, filepath))
                 
         dlg.Destroy()
         
+    def on_plot_exported(self, future, filepath):
+        """Report the outcome of a background plot export (GUI thread)"""
+        self.export_plot_btn.Enable()
+        self.SetStatusText("Ready")
+        
+        try:
+            future.result()
+            wx.MessageBox(f"Plot saved successfully to:\n{filepath}", "Export Complete", wx.OK | wx.ICON_INFORMATION)
+        except Exception as e:
+            wx.MessageBox(f"Error saving plot: {str(e)}", "Export Error", wx.OK | wx.ICON_ERROR)
+        
     def on_batch_download(self, event):
         """Add all filtered datasets to download queue"""
         for dataset in self.filtered_data:
-            index = self.download_list.GetItemCount()
-            dataset_title = dataset.get('ecosis', {}).get('package_title', 'Unknown')
-            self.download_list.InsertItem(index, dataset_title)
-            self.download_list.SetItem(index, 1, "Queued")
-            self.download_list.SetItem(index, 2, "0%")
-            self.download_list.SetItem(index, 3, "Unknown")
+            self.queue_download(dataset)
 
     def on_api_settings(self, event):
         """Show API settings dialog"""
@@ -3476,6 +4552,14 @@ class EcosysAPICurator(wx.Frame):
         
     def on_refresh(self, event):
         """Refresh data from API"""
+        # An explicit refresh always goes back to the server and rescans the download folder
+        self.stats_cache.clear()
+        self.check_local_data()
+        if hasattr(self.session, 'cache'):
+            try:
+                self.session.cache.clear()
+            except Exception as e:
+                logger.debug("Could not clear HTTP cache: %s", e)
         self.load_api_data_threaded()
         
     def on_exit(self, event):
@@ -3483,8 +4567,9 @@ class EcosysAPICurator(wx.Frame):
         # Set destruction flag immediately
         self._destroyed = True
         
-        # Stop all timers
+        # Stop all timers and background work
         self.cleanup_timers_safe()
+        self.cleanup_threads()
         
         # Save configuration
         self.save_config()
@@ -3554,5 +4639,8 @@ class EcosysApp(wx.App):
 
 
 if __name__ == '__main__':
+    # Debug tracing is off unless started with --debug
+    log_level = logging.DEBUG if '--debug' in sys.argv[1:] else logging.WARNING
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
     app = EcosysApp()
     app.MainLoop()